@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-import io
+from datetime import timedelta
 import json
 import logging
 import os
@@ -18,16 +17,16 @@ from websockets.exceptions import ConnectionClosed
 import aiohttp
 import filelock
 import grpc
-from grpc import ssl_channel_credentials, StatusCode
 from grpc.aio import Call, Channel, insecure_channel, secure_channel, UnaryStreamCall
 
-from .client import _audio_begins_at, CLIENT_RETRY_OPTIONS, CongestionCtrl, \
-        http_prepare_dict, output_format_to_mime_type, TTSOptions, Format
+from .client import _audio_begins_at, _backoff_schedule, _ChannelPool, CongestionCtrl, _COORDINATES_REFRESH_MARGIN, \
+        http_prepare_dict, MAX_ERROR_BODY_BYTES, output_format_to_mime_type, _RETRYABLE_STATUS_CODES, \
+        _ssl_credentials, TTSOptions, Format, WS_OPEN_TIMEOUT, WS_PING_INTERVAL, WS_PING_TIMEOUT
 from .inference_coordinates import get_coordinates_async, InferenceCoordinatesOptions
 from .lease import Lease, LeaseFactory
-from .protos import api_pb2, api_pb2_grpc
+from .protos import api_pb2
 from .telemetry import Metrics, Telemetry
-from .utils import prepare_text, SENTENCE_END_REGEX, get_voice_engine_and_protocol
+from .utils import is_sentence_end, json_dumps, prepare_text, get_voice_engine_and_protocol
 
 
 TtsUnaryStream = UnaryStreamCall[api_pb2.TtsRequest, api_pb2.TtsResponse]
@@ -58,9 +57,12 @@ class AsyncClient:
         congestion_ctrl: CongestionCtrl = CongestionCtrl.OFF
         metrics_buffer_size: int = 1000
         remove_ssml_tags: bool = False
+        # Seconds between no-op requests that keep idle HTTP connections warm; None disables them.
+        keepalive_interval: Optional[float] = 60.0
 
         # gRPC (PlayHT2.0-turbo, Play3.0-mini-grpc)
         grpc_addr: Optional[str] = None
+        grpc_channel_pool_size: int = 4
         insecure: bool = False
         fallback_enabled: bool = False
         auto_refresh_lease: bool = True
@@ -88,7 +90,7 @@ class AsyncClient:
             maybe_data = await self._lease_cache_read()
             if maybe_data is not None:
                 lease = Lease(maybe_data)
-                if lease.expires > datetime.now() + timedelta(minutes=5):
+                if lease.valid_for(timedelta(minutes=5)):
                     return lease
             lease = await asyncio.to_thread(_factory)
             await self._lease_cache_write(lease.data)
@@ -96,9 +98,13 @@ class AsyncClient:
 
         self._lease_factory = lease_factory
         self._lease: Optional[Lease] = None
-        self._rpc: Optional[Tuple[str, Channel]] = None
-        self._fallback_rpc: Optional[Tuple[str, Channel]] = None
+        self._rpc: Optional[_ChannelPool] = None
+        self._fallback_rpc: Optional[_ChannelPool] = None
+        # (lease, rpc) published together by refresh_lease so the gRPC path can read both without taking the lock.
+        self._grpc_session: Optional[Tuple[Lease, _ChannelPool]] = None
         self._lock = asyncio.Lock()
+        # Set while a lease refresh is in flight; concurrent refresh_lease() calls wait on it instead of fetching.
+        self._lease_refresh: Optional[asyncio.Future] = None
         self._stop_lease_loop = asyncio.Event()
         if self._advanced.auto_refresh_lease:
             self._lease_loop_future = asyncio.ensure_future(self._lease_loop())
@@ -109,7 +115,12 @@ class AsyncClient:
         self._user_id = user_id
         self._api_key = api_key
         self._inference_coordinates: Optional[Dict[str, Any]] = None
+        self._coordinates_refresh_at = 0.0
         self._ws: Optional[ClientConnection] = None
+        self._keepalive_future: Optional[asyncio.Future] = None
+        self._coordinates_refresh_future: Optional[asyncio.Future] = None
+        # Created lazily since aiohttp sessions must be constructed inside the running event loop.
+        self._http: Optional[aiohttp.ClientSession] = None
 
         if self._advanced.congestion_ctrl == CongestionCtrl.STATIC_MAR_2023:
             self._max_attempts = 3
@@ -117,15 +128,18 @@ class AsyncClient:
         else:
             self._max_attempts = 1
             self._backoff = 0
+        self._backoff_schedule = _backoff_schedule(self._max_attempts, self._backoff)
 
         if auto_connect and not self._advanced.auto_refresh_lease:
             asyncio.ensure_future(self.refresh_lease())
         if auto_connect:
             asyncio.ensure_future(self.warmup())
+            if self._advanced.keepalive_interval:
+                self._keepalive_future = asyncio.ensure_future(self._keepalive_loop())
 
     async def ensure_inference_coordinates(self, force: bool = False):
         if self._inference_coordinates is None or \
-                self._inference_coordinates["refresh_at_ms"] < time.time_ns() // 1000000 or \
+                self._coordinates_refresh_at < time.monotonic() or \
                 force:
             if self._advanced.inference_coordinates_options.coordinates_generator_function_async is not None:
                 self._inference_coordinates = await self._advanced.inference_coordinates_options.\
@@ -133,33 +147,70 @@ class AsyncClient:
                                                              self._advanced.inference_coordinates_options)
             else:
                 self._inference_coordinates = await get_coordinates_async(self._user_id, self._api_key,
-                                                                          self._advanced.inference_coordinates_options)
+                                                                          self._advanced.inference_coordinates_options,
+                                                                          session=self._get_http_session(),
+                                                                          force=force)
+
+            # refresh_at_ms is wall-clock; convert it once to a monotonic deadline.
+            self._coordinates_refresh_at = time.monotonic() + \
+                (self._inference_coordinates["refresh_at_ms"] - time.time() * 1000) / 1000
+            if self._coordinates_refresh_future is None and not self._stop_lease_loop.is_set():
+                self._coordinates_refresh_future = asyncio.ensure_future(self._coordinates_refresh_loop())
 
         assert self._inference_coordinates is not None, "No connection"
 
+    async def _coordinates_refresh_loop(self):
+        retry_in: Optional[float] = None
+        while not self._stop_lease_loop.is_set():
+            if retry_in is None:
+                await asyncio.sleep(max(_COORDINATES_REFRESH_MARGIN, self._coordinates_refresh_at - time.monotonic() -
+                                        _COORDINATES_REFRESH_MARGIN))
+            else:
+                await asyncio.sleep(retry_in)
+            try:
+                # Renews the coordinates before their deadline, so requests never wait on /sdk-auth for them.
+                await self.ensure_inference_coordinates(force=True)
+                retry_in = None
+            except Exception as e:
+                logging.warning(f"Failed to refresh inference coordinates, retrying in 30s: {e}")
+                retry_in = 30
+
     async def warmup(self):
         await self.ensure_inference_coordinates()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                assert self._inference_coordinates is not None, "No connection"
-                async with session.options(self._inference_coordinates["Play3.0-mini"]["http_streaming_url"],
-                                           headers={"Origin": "https://play.ht",
-                                                    "Access-Control-Request-Method": "POST"}) as resp:
-                    resp.raise_for_status()
+            session = self._get_http_session()
+            assert self._inference_coordinates is not None, "No connection"
+            async with session.options(self._inference_coordinates["Play3.0-mini"]["http_streaming_url"],
+                                       headers={"Origin": "https://play.ht",
+                                                "Access-Control-Request-Method": "POST"}) as resp:
+                resp.raise_for_status()
         except Exception as e:
             logging.warning(f"Failed to warmup: {e}")
 
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=64))
+        return self._http
+
+    async def _keepalive_loop(self):
+        assert self._advanced.keepalive_interval
+        while not self._stop_lease_loop.is_set():
+            await asyncio.sleep(self._advanced.keepalive_interval)
+            try:
+                # The coordinates are renewed ahead of time by _coordinates_refresh_loop; this just pings.
+                await self.warmup()
+            except Exception as e:
+                logging.debug(f"Keepalive failed: {e}")
+
     @classmethod
     async def _lease_cache_read(cls) -> Optional[bytes]:
         def get_file():
+            # Writers replace the file atomically, so it can be read without the file lock.
             try:
-                with filelock.FileLock(cls.LEASE_CACHE_PATH + '.lock'):
-                    if not os.path.exists(cls.LEASE_CACHE_PATH):
-                        return None
-                    with open(cls.LEASE_CACHE_PATH, 'rb') as fp:
-                        return fp.read()
-            except IOError:
+                with open(cls.LEASE_CACHE_PATH, 'rb') as fp:
+                    return fp.read()
+            except IOError:  # includes FileNotFoundError when nothing has been cached yet
                 return None
 
         async with cls.LEASE_LOCK:
@@ -171,9 +222,11 @@ class AsyncClient:
     async def _lease_cache_write(cls, data: bytes):
         def write_file():
             try:
+                tmp_path = f"{cls.LEASE_CACHE_PATH}.{os.getpid()}.tmp"
                 with filelock.FileLock(cls.LEASE_CACHE_PATH + '.lock'):
-                    with open(cls.LEASE_CACHE_PATH, 'wb') as fp:
+                    with open(tmp_path, 'wb') as fp:
                         fp.write(data)
+                    os.replace(tmp_path, cls.LEASE_CACHE_PATH)
             except IOError:
                 return
 
@@ -187,44 +240,84 @@ class AsyncClient:
             await self.refresh_lease()
             await asyncio.sleep(refresh_time.total_seconds())
 
+    def _channel_pool(self, addr: str, insecure: bool) -> _ChannelPool:
+        def channel_factory(options: list[Tuple[str, Any]]) -> Channel:
+            if insecure:
+                return insecure_channel(addr, options=options)
+            return secure_channel(addr, _ssl_credentials(), options=options)
+        return _ChannelPool(addr, channel_factory, self._advanced.grpc_channel_pool_size)
+
     async def refresh_lease(self):
         """Manually refresh credentials with Play."""
         async with self._lock:
-            if self._lease and self._lease.expires > datetime.now() + timedelta(minutes=5):
+            if self._stop_lease_loop.is_set():
+                raise RuntimeError("Client is closed")
+            if self._lease and self._lease.valid_for(timedelta(minutes=5)):
                 # Lease is still valid for at least the next 5 minutes.
                 return
-            self._lease = await self._lease_factory()
-
-            grpc_addr = self._advanced.grpc_addr or self._lease.metadata["inference_address"]
-
-            if self._rpc and self._rpc[0] != grpc_addr:
-                await self._rpc[1].close()
-                self._rpc = None
-            if self._rpc is None:
-                insecure = self._advanced.insecure or "on-prem.play.ht" in grpc_addr
-                channel = (
-                    insecure_channel(grpc_addr, options=CLIENT_RETRY_OPTIONS) if insecure
-                    else secure_channel(grpc_addr, ssl_channel_credentials(), options=CLIENT_RETRY_OPTIONS)
-                )
-                self._rpc = (grpc_addr, channel)
-
-            # Maybe set up a fallback grpc client
-            if self._advanced.fallback_enabled:
-                # Choose the fallback address
-                # For now, this always is the inference address in the lease, but we can extend in the future
-                fallback_addr = self._lease.metadata["inference_address"]
-
-                # Only do fallback if the fallback address is not the same as the primary address
-                if grpc_addr != fallback_addr:
-                    if self._fallback_rpc and self._fallback_rpc[0] != fallback_addr:
-                        await self._fallback_rpc[1].close()
-                        self._fallback_rpc = None
-                    if self._fallback_rpc is None:
-                        channel = (
-                            insecure_channel(fallback_addr, options=CLIENT_RETRY_OPTIONS) if self._advanced.insecure
-                            else secure_channel(fallback_addr, ssl_channel_credentials(), options=CLIENT_RETRY_OPTIONS)
-                        )
-                        self._fallback_rpc = (fallback_addr, channel)
+            if self._lease_refresh is None:
+                self._lease_refresh = asyncio.ensure_future(self._refresh_lease())
+                self._lease_refresh.add_done_callback(self._lease_refresh_done)
+            refresh = self._lease_refresh
+        # The refresh runs as its own task, so a caller that is cancelled doesn't cancel it for the others.
+        await asyncio.shield(refresh)
+
+    def _lease_refresh_done(self, refresh: asyncio.Future):
+        self._lease_refresh = None
+        if not refresh.cancelled():
+            refresh.exception()  # mark retrieved so a refresh nobody waits on anymore isn't logged as unhandled
+
+    async def _refresh_lease(self):
+        async with self._lock:
+            rpc, fallback_rpc = self._rpc, self._fallback_rpc
+
+        # Fetch the lease and build any new channels outside the lock; only the swap below is locked.
+        lease = await self._lease_factory()
+
+        grpc_addr = self._advanced.grpc_addr or lease.metadata["inference_address"]
+
+        # The lease travels with each request, not the channel, so a rotated lease keeps the existing pool and its
+        # HTTP/2 connections. Channels are rebuilt only when the inference address actually moves.
+        new_rpc = None
+        if rpc is None or rpc.addr != grpc_addr:
+            insecure = self._advanced.insecure or "on-prem.play.ht" in grpc_addr
+            new_rpc = self._channel_pool(grpc_addr, insecure)
+
+        # Maybe set up a fallback grpc client
+        new_fallback_rpc = None
+        if self._advanced.fallback_enabled:
+            # Choose the fallback address
+            # For now, this always is the inference address in the lease, but we can extend in the future
+            fallback_addr = lease.metadata["inference_address"]
+
+            # Only do fallback if the fallback address is not the same as the primary address
+            if grpc_addr != fallback_addr and (fallback_rpc is None or fallback_rpc.addr != fallback_addr):
+                new_fallback_rpc = self._channel_pool(fallback_addr, self._advanced.insecure)
+
+        stale: list[_ChannelPool] = []
+        async with self._lock:
+            if self._stop_lease_loop.is_set():
+                # close() ran while the lease was being fetched; don't bring back the channels it shut down.
+                for pool in (new_rpc, new_fallback_rpc):
+                    if pool is not None:
+                        await _close_channel_pool(pool)
+                raise RuntimeError("Client is closed")
+            self._lease = lease
+            if new_rpc is not None:
+                if self._rpc is not None:
+                    stale.append(self._rpc)
+                self._rpc = new_rpc
+            if new_fallback_rpc is not None:
+                if self._fallback_rpc is not None:
+                    stale.append(self._fallback_rpc)
+                self._fallback_rpc = new_fallback_rpc
+            if self._rpc is not None:
+                self._grpc_session = (lease, self._rpc)
+
+        # Pools still streaming are closed by their last request instead.
+        for pool in stale:
+            if pool.retire():
+                await _close_channel_pool(pool)
 
     async def stream_tts_input(
         self,
@@ -235,19 +328,18 @@ class AsyncClient:
         streaming: bool = True
     ):
         """Stream input to Play via the text_stream object."""
-        buffer = io.StringIO()
+        parts: list[str] = []
         async for text in text_stream:
             t = text.strip()
-            buffer.write(t)
-            buffer.write(" ")  # normalize word spacing.
-            if SENTENCE_END_REGEX.match(t) is None:
+            parts.append(t)  # words are re-joined with single spaces to normalize spacing.
+            if not is_sentence_end(t):
                 continue
-            async for data in self.tts(buffer.getvalue(), options, voice_engine, protocol, streaming):
+            async for data in self.tts(" ".join(parts), options, voice_engine, protocol, streaming):
                 yield data
-            buffer = io.StringIO()
+            parts.clear()
         # If text_stream closes, send all remaining text, regardless of sentence structure.
-        if buffer.tell() > 0:
-            async for data in self.tts(buffer.getvalue(), options, voice_engine, protocol, streaming):
+        if parts:
+            async for data in self.tts(" ".join(parts), options, voice_engine, protocol, streaming):
                 yield data
 
     def tts(
@@ -292,72 +384,91 @@ class AsyncClient:
             raise ValueError(f"Only {supported_voice_engines} are supported in the gRPC API; got {voice_engine}")
 
         start = time.perf_counter()
-        await self.refresh_lease()
-        async with self._lock:
-            assert self._lease is not None and self._rpc is not None, "No connection"
-            lease_data = self._lease.data
-
-        text = prepare_text(text, self._advanced.remove_ssml_tags)
-        metrics.append("text", str(text)).append("endpoint", str(self._rpc[0]))
-
+        audio_begins_at = _audio_begins_at(options.format)
         if options.format == Format.FORMAT_PCM:
             raise ValueError("PCM format is not supported in the gRPC API")
-        request = api_pb2.TtsRequest(params=options.tts_params(text, voice_engine), lease=lease_data)
-
-        for attempt in range(1, self._max_attempts + 1):
-            try:
-                stub = api_pb2_grpc.TtsStub(self._rpc[1])
-                stream: TtsUnaryStream = stub.Tts(request)
-                chunk_idx = -1
-                if context is not None:
-                    context.assign(stream)
-                async for chunk in stream:
-                    chunk_idx += 1
-                    if chunk_idx == _audio_begins_at(options.format):
-                        metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
-                    yield chunk.data
-                metrics.finish_ok()
+        while True:
+            session = self._grpc_session
+            if session is None or not session[0].valid_for(timedelta(minutes=5)):
+                await self.refresh_lease()
+                session = self._grpc_session
+            assert session is not None, "No connection"
+            lease, rpc = session
+            # A refresh may have retired and closed this pool since it was read; then use its replacement.
+            if rpc.acquire():
                 break
-            except grpc.RpcError as e:
-                error_code = getattr(e, "code")()
-                logging.debug(f"Error: {error_code}")
-                if error_code not in {StatusCode.RESOURCE_EXHAUSTED, StatusCode.UNAVAILABLE}:
-                    raise
+        fallback_rpc = self._fallback_rpc
+        if fallback_rpc is not None and not fallback_rpc.acquire():
+            fallback_rpc = None
+        lease_data = lease.data
 
-                if attempt < self._max_attempts:
-                    logging.debug(f"Retrying in {self._backoff*1000} sec ({attempt} attempts so far); ({error_code})")
-                    metrics.inc("retry").append("retry.reason", str(error_code))
-                    metrics.start_timer("retry-backoff")
-                    if self._backoff > 0:
-                        await asyncio.sleep(self._backoff)
-                    metrics.finish_timer("retry-backoff")
-                    continue
+        try:
+            text = prepare_text(text, self._advanced.remove_ssml_tags)
+            metrics.append("text", text).append("endpoint", str(rpc.addr))
 
-                if self._fallback_rpc is None:
-                    raise
+            request = api_pb2.TtsRequest(lease=lease_data)
+            options._fill_tts_params(request.params, text, voice_engine)
 
-                # We log fallbacks to give customers an extra signal that they should scale up their on-prem appliance
-                # (e.g. by paying for more GPU quota)
-                logging.info(f"Falling back to {self._fallback_rpc[0]} because {self._rpc[0]} threw: {error_code}")
-                metrics.inc("fallback").append("fallback.reason", str(error_code))
+            for attempt in range(1, self._max_attempts + 1):
                 try:
-                    metrics.append("text", str(request.params.text)).append("endpoint", str(self._fallback_rpc[0]))
-                    metrics.start_timer("time-to-first-audio")
-                    stub = api_pb2_grpc.TtsStub(self._fallback_rpc[1])
-                    stream: TtsUnaryStream = stub.Tts(request)
+                    stream: TtsUnaryStream = rpc.next_stub().Tts(request)
                     chunk_idx = -1
                     if context is not None:
                         context.assign(stream)
                     async for chunk in stream:
-                        chunk_idx += 1
-                        if chunk_idx == _audio_begins_at(options.format):
-                            metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
+                        # Only the first few chunks need counting; afterwards this is a single comparison.
+                        if chunk_idx < audio_begins_at:
+                            chunk_idx += 1
+                            if chunk_idx == audio_begins_at:
+                                metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
                         yield chunk.data
                     metrics.finish_ok()
                     break
-                except grpc.RpcError as fallback_e:
-                    metrics.finish_error(str(fallback_e))
-                    raise fallback_e from e
+                except grpc.RpcError as e:
+                    error_code = getattr(e, "code")()
+                    logging.debug(f"Error: {error_code}")
+                    if error_code not in _RETRYABLE_STATUS_CODES:
+                        raise
+
+                    if attempt < self._max_attempts:
+                        backoff = self._backoff_schedule[attempt - 1]
+                        logging.debug(f"Retrying in {backoff*1000} ms ({attempt} attempts so far); ({error_code})")
+                        metrics.inc("retry").append("retry.reason", str(error_code))
+                        if backoff > 0:
+                            metrics.start_timer("retry-backoff")
+                            await asyncio.sleep(backoff)
+                            metrics.finish_timer("retry-backoff")
+                        continue
+
+                    if fallback_rpc is None:
+                        raise
+
+                    # We log fallbacks to give customers an extra signal that they should scale up their on-prem
+                    # appliance (e.g. by paying for more GPU quota)
+                    logging.info(f"Falling back to {fallback_rpc.addr} because {rpc.addr} threw: {error_code}")
+                    metrics.inc("fallback").append("fallback.reason", str(error_code))
+                    try:
+                        metrics.append("endpoint", str(fallback_rpc.addr))
+                        metrics.start_timer("time-to-first-audio")
+                        stream: TtsUnaryStream = fallback_rpc.next_stub().Tts(request)
+                        chunk_idx = -1
+                        if context is not None:
+                            context.assign(stream)
+                        async for chunk in stream:
+                            if chunk_idx < audio_begins_at:
+                                chunk_idx += 1
+                                if chunk_idx == audio_begins_at:
+                                    metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
+                            yield chunk.data
+                        metrics.finish_ok()
+                        break
+                    except grpc.RpcError as fallback_e:
+                        metrics.finish_error(str(fallback_e))
+                        raise fallback_e from e
+        finally:
+            for pool in (rpc, fallback_rpc):
+                if pool is not None and pool.release():
+                    await _close_channel_pool(pool)
 
     async def _tts_http(
         self,
@@ -373,55 +484,60 @@ class AsyncClient:
             raise ValueError(f"Only {supported_voice_engines} are supported in the HTTP API; got {voice_engine}")
 
         start = time.perf_counter()
+        audio_begins_at = _audio_begins_at(options.format)
         await self.ensure_inference_coordinates()
         assert self._inference_coordinates is not None, "No connection"
 
-        if streaming:
-            url = self._inference_coordinates[voice_engine]["http_streaming_url"]
-        else:
-            url = self._inference_coordinates[voice_engine]["http_nonstreaming_url"]
+        url_key = "http_streaming_url" if streaming else "http_nonstreaming_url"
+        url = self._inference_coordinates[voice_engine][url_key]
 
         text = prepare_text(text, self._advanced.remove_ssml_tags)
-        metrics.append("text", str(text)).append("endpoint", str(url))
+        metrics.append("text", text).append("endpoint", str(url))
+        body = http_prepare_dict(text, options, voice_engine)
 
         for attempt in range(1, self._max_attempts + 1):
             try:
-                async with aiohttp.ClientSession() as session:
-                    assert self._inference_coordinates is not None, "No connection"
-                    async with session.post(
-                            url,
-                            headers={
-                                "accept": output_format_to_mime_type(options.format),
-                            },
-                            json=http_prepare_dict(text, options, voice_engine),
-                            chunked=True
-                    ) as response:
-                        if response.status != 200:
-                            raise Exception(f"HTTP {response.status}: {await response.text()}", response.status)
-                        chunk_idx = -1
-                        async for chunk in response.content.iter_any():
+                session = self._get_http_session()
+                async with session.post(
+                        url,
+                        headers={
+                            "accept": output_format_to_mime_type(options.format),
+                        },
+                        json=body,
+                        chunked=True
+                ) as response:
+                    if response.status != 200:
+                        error_body = await response.content.read(MAX_ERROR_BODY_BYTES)
+                        raise Exception(f"HTTP {response.status}: {error_body.decode(errors='replace')}",
+                                        response.status)
+                    chunk_idx = -1
+                    async for chunk in response.content.iter_any():
+                        if chunk_idx < audio_begins_at:
                             chunk_idx += 1
-                            if chunk_idx == _audio_begins_at(options.format):
+                            if chunk_idx == audio_begins_at:
                                 metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
-                            yield chunk
-                        metrics.finish_ok()
-                        break
+                        yield chunk
+                    metrics.finish_ok()
+                    break
             except Exception as e:
                 logging.debug(f"Error: {e}")
                 if e.args[1] == "401":
-                    await self.ensure_inference_coordinates()
+                    await self.ensure_inference_coordinates(force=True)
+                    assert self._inference_coordinates is not None, "No connection"
+                    url = self._inference_coordinates[voice_engine][url_key]
                 elif e.args[1] not in {429, 503}:  # HTTP equivalent to gRPC RESOURCE_EXHAUSTED, UNAVAILABLE
                     metrics.finish_error(str(e))
                     raise
 
                 if attempt < self._max_attempts:
                     # It's poor customer experience to show internal details about retries, so we only debug log here.
-                    logging.debug(f"Retrying in {self._backoff*1000} sec ({attempt} attempts so far); ({e.args[1]})")
+                    backoff = self._backoff_schedule[attempt - 1]
+                    logging.debug(f"Retrying in {backoff*1000} ms ({attempt} attempts so far); ({e.args[1]})")
                     metrics.inc("retry").append("retry.reason", str(e.args[1]))
-                    metrics.start_timer("retry-backoff")
-                    if self._backoff > 0:
-                        await asyncio.sleep(self._backoff)
-                    metrics.finish_timer("retry-backoff")
+                    if backoff > 0:
+                        metrics.start_timer("retry-backoff")
+                        await asyncio.sleep(backoff)
+                        metrics.finish_timer("retry-backoff")
                     continue
 
                 metrics.finish_error(str(e))
@@ -440,59 +556,81 @@ class AsyncClient:
             raise ValueError(f"Only {supported_voice_engines} are supported in the WebSocket API; got {voice_engine}")
 
         start = time.perf_counter()
+        audio_begins_at = _audio_begins_at(options.format)
         await self.ensure_inference_coordinates()
 
         text = prepare_text(text, self._advanced.remove_ssml_tags)
         assert self._inference_coordinates is not None, "No connection"
-        metrics.append("text", str(text)).append("endpoint",
-                                                 str(self._inference_coordinates[voice_engine]["websocket_url"]))
+        ws_address = self._inference_coordinates[voice_engine]["websocket_url"]
+        metrics.append("text", text).append("endpoint", str(ws_address))
         request_id = str(uuid.uuid4())
         json_data = http_prepare_dict(text, options, voice_engine)
         json_data["request_id"] = request_id
+        payload = json_dumps(json_data)  # sent as a text frame
 
         for attempt in range(1, self._max_attempts + 1):
             try:
-                assert self._inference_coordinates is not None, "No connection"
-                ws_address = self._inference_coordinates[voice_engine]["websocket_url"]
-                if self._ws is None:
-                    self._ws = await connect(ws_address)
+                # Take the idle socket for the whole request, so concurrent requests open their own rather than
+                # interleaving frames on it. It's handed back only once its response has been read to the end; a
+                # request that fails or is abandoned part-way closes it instead.
+                ws, self._ws = self._ws, None
+                finished = False
                 try:
-                    await self._ws.send(json.dumps(json_data))
-                except ConnectionClosed as e:
-                    logging.debug(f"Reconnecting websocket which closed unexpectedly: {e}")
-                    self._ws = await connect(ws_address)
-                    await self._ws.send(json.dumps(json_data))
-                chunk_idx = -1
-                async for chunk in self._ws:
-                    chunk_idx += 1
-                    if isinstance(chunk, str):
-                        msg = json.loads(chunk)
-                        if msg["type"] == "end":
-                            break
-                        else:
-                            continue
-                    elif chunk_idx == _audio_begins_at(options.format):
-                        metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
-                    yield chunk
+                    if ws is None:
+                        ws = await self._ws_connect(ws_address)
+                    try:
+                        await ws.send(payload)
+                    except ConnectionClosed as e:
+                        logging.debug(f"Reconnecting websocket which closed unexpectedly: {e}")
+                        ws = await self._ws_connect(ws_address)
+                        await ws.send(payload)
+                    chunk_idx = -1
+                    async for chunk in ws:
+                        if chunk_idx < audio_begins_at:
+                            chunk_idx += 1
+                            if chunk_idx == audio_begins_at and not isinstance(chunk, str):
+                                metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
+                        if isinstance(chunk, str):
+                            msg = json.loads(chunk)
+                            if msg["type"] == "end":
+                                finished = True
+                                break
+                            else:
+                                continue
+                        yield chunk
+                finally:
+                    if ws is not None and finished and self._ws is None and not self._stop_lease_loop.is_set():
+                        self._ws, ws = ws, None
+                    if ws is not None:
+                        await ws.close()
                 metrics.finish_ok()
                 break
             except Exception as e:
                 logging.debug(f"Error: {e}")
                 if attempt < self._max_attempts:
+                    reason = e.args[1] if len(e.args) > 1 else type(e).__name__
                     # It's poor customer experience to show internal details about retries, so we only debug log here.
-                    logging.debug(f"Retrying in {self._backoff*1000} ms ({attempt} attempts so far); ({e.args[1]})")
-                    metrics.inc("retry").append("retry.reason", str(e.args[1]))
-                    metrics.start_timer("retry-backoff")
-                    if self._backoff > 0:
-                        await asyncio.sleep(self._backoff)
-                    metrics.finish_timer("retry-backoff")
+                    backoff = self._backoff_schedule[attempt - 1]
+                    logging.debug(f"Retrying in {backoff*1000} ms ({attempt} attempts so far); ({reason})")
+                    metrics.inc("retry").append("retry.reason", str(reason))
+                    if backoff > 0:
+                        metrics.start_timer("retry-backoff")
+                        await asyncio.sleep(backoff)
+                        metrics.finish_timer("retry-backoff")
                     # In case it was an expired token, refresh it
                     await self.ensure_inference_coordinates(force=True)
+                    assert self._inference_coordinates is not None, "No connection"
+                    ws_address = self._inference_coordinates[voice_engine]["websocket_url"]
                     continue
 
                 metrics.finish_error(str(e))
                 raise
 
+    @staticmethod
+    async def _ws_connect(ws_address: str) -> ClientConnection:
+        return await connect(ws_address, open_timeout=WS_OPEN_TIMEOUT,
+                             ping_interval=WS_PING_INTERVAL, ping_timeout=WS_PING_TIMEOUT)
+
     def get_stream_pair(
         self,
         options: TTSOptions,
@@ -511,27 +649,46 @@ class AsyncClient:
         )
 
     async def close(self):
+        if self._stop_lease_loop.is_set():
+            return
         self._stop_lease_loop.set()
         if not self._lease_loop_future.done():
             self._lease_loop_future.cancel()
-        if self._rpc is not None:
-            await self._rpc[1].close()
-            self._rpc = None
-        if self._fallback_rpc is not None:
-            await self._fallback_rpc[1].close()
-            self._fallback_rpc = None
+        for future in (self._keepalive_future, self._coordinates_refresh_future):
+            if future is not None and not future.done():
+                future.cancel()
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            await ws.close()
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+        self._grpc_session = None
+        # Requests already streaming finish on their pools, which the last of them then closes.
+        for pool in (self._rpc, self._fallback_rpc):
+            if pool is not None and pool.retire():
+                await _close_channel_pool(pool)
+        self._rpc = self._fallback_rpc = None
 
     def __del__(self):
+        # May run during interpreter shutdown or on a partially constructed client; never raise from here.
         try:
-            asyncio.get_running_loop()
-            asyncio.ensure_future(self.close())
-        except RuntimeError:
-            asyncio.run(self.close())
+            try:
+                asyncio.get_running_loop()
+                asyncio.ensure_future(self.close())
+            except RuntimeError:
+                asyncio.run(self.close())
+        except Exception:
+            pass
 
     def metrics(self) -> list[Metrics]:
         return self._telemetry.metrics()
 
 
+async def _close_channel_pool(pool: _ChannelPool):
+    await asyncio.gather(*(channel.close() for channel in pool.channels))
+
+
 class UnaryStreamRendezvous(AsyncIterator[api_pb2.TtsResponse], Call):
     pass
 
@@ -626,25 +783,25 @@ class _OutputStream(AsyncIterator[bytes]):
         output_stream.close()
     """
     def __init__(self, q: asyncio.Queue[Optional[bytes]]):
-        self._close = asyncio.Event()
         self._q = q
+        self._closed = False
+        self._done = False
 
     def __aiter__(self) -> AsyncIterator[bytes]:
         return self
 
     async def __anext__(self) -> bytes:
-        while True:
-            try:
-                value = await asyncio.wait_for(self._q.get(), timeout=0.05)
-                break
-            except asyncio.TimeoutError as e:
-                if self._close.is_set():
-                    raise StopAsyncIteration() from e
-                continue
+        if self._done:
+            raise StopAsyncIteration()
+        # Both the listener and close() end the stream with a None sentinel, so a plain blocking get suffices.
+        value = await self._q.get()
         if value is None:
+            self._done = True
             raise StopAsyncIteration()
-        else:
-            return value
+        return value
 
     def close(self):
-        self._close.set()
+        if self._closed:
+            return
+        self._closed = True
+        self._q.put_nowait(None)
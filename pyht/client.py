@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import timedelta
 from enum import Enum
-from typing import Any, Dict, Generator, Iterable, Iterator, List, Tuple, Optional, Union
-import io
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, Iterator, List, Set, Tuple, Optional, Union
+import collections
+import concurrent.futures
+import functools
+import heapq
+import itertools
 import json
 import logging
 import os
-import queue
+import random
 import tempfile
 import threading
 import time
 import uuid
+import weakref
 from websockets.sync.client import connect, ClientConnection
 from websockets.exceptions import ConnectionClosed
 
@@ -20,15 +25,21 @@ import filelock
 import grpc
 from grpc import Channel, insecure_channel, secure_channel, ssl_channel_credentials, StatusCode
 import requests
+from requests.adapters import HTTPAdapter
 
 from .inference_coordinates import get_coordinates, InferenceCoordinatesOptions
 from .lease import Lease, LeaseFactory
 from .protos import api_pb2, api_pb2_grpc
 from .telemetry import Metrics, Telemetry
-from .utils import prepare_text, SENTENCE_END_REGEX, get_voice_engine_and_protocol
+from .utils import is_sentence_end, json_dumps, prepare_text, get_voice_engine_and_protocol
 
 
 CLIENT_RETRY_OPTIONS = [
+        # Ping only while calls are open, no more often than gRPC servers allow by default (5 minutes); more frequent
+        # or idle pings get the pooled channels a GOAWAY "too_many_pings".
+        ("grpc.keepalive_time_ms", 300000),
+        ("grpc.keepalive_timeout_ms", 10000),
+        ("grpc.http2.max_pings_without_data", 0),
         ("grpc.enable_retries", 1),
         ("grpc.service_config", json.dumps({
             "methodConfig": [{
@@ -45,6 +56,18 @@ CLIENT_RETRY_OPTIONS = [
     ]
 
 
+# Status codes worth retrying (and then falling back on); anything else is raised immediately.
+_RETRYABLE_STATUS_CODES = frozenset({StatusCode.RESOURCE_EXHAUSTED, StatusCode.UNAVAILABLE})
+
+# Error responses are only surfaced in exception messages; don't buffer more than this much of them.
+MAX_ERROR_BODY_BYTES = 4096
+
+# Seconds to wait for a websocket handshake; its keepalive pings run every WS_PING_INTERVAL seconds (async only).
+WS_OPEN_TIMEOUT = 10
+WS_PING_INTERVAL = 20
+WS_PING_TIMEOUT = 20
+
+
 class Format(Enum):
     FORMAT_RAW = api_pb2.FORMAT_RAW
     FORMAT_MP3 = api_pb2.FORMAT_MP3
@@ -75,23 +98,35 @@ class CandidateRankingMethod(Enum):
     XLSAlignerRank = "xls_aligner"
 
 
+# Format values are the proto enum numbers, which are contiguous from 0, so per-format tables are plain tuples.
+assert [fmt.value for fmt in Format] == list(range(len(Format)))
+
+_HTTP_FORMATS: Tuple[HTTPFormat, ...] = (
+    HTTPFormat.FORMAT_RAW,
+    HTTPFormat.FORMAT_MP3,
+    HTTPFormat.FORMAT_WAV,
+    HTTPFormat.FORMAT_OGG,
+    HTTPFormat.FORMAT_FLAC,
+    HTTPFormat.FORMAT_MULAW,
+    HTTPFormat.FORMAT_PCM,
+)
+
+# Index of the first chunk carrying audio; headerless formats start immediately.
+_AUDIO_BEGINS_AT: Tuple[int, ...] = (
+    0,  # FORMAT_RAW
+    1,  # FORMAT_MP3
+    1,  # FORMAT_WAV
+    1,  # FORMAT_OGG
+    1,  # FORMAT_FLAC
+    0,  # FORMAT_MULAW
+    1,  # FORMAT_PCM
+)
+
+
 def grpc_format_to_http_format(format: Format) -> HTTPFormat:
-    if format == Format.FORMAT_RAW:
-        return HTTPFormat.FORMAT_RAW
-    elif format == Format.FORMAT_MP3:
-        return HTTPFormat.FORMAT_MP3
-    elif format == Format.FORMAT_WAV:
-        return HTTPFormat.FORMAT_WAV
-    elif format == Format.FORMAT_OGG:
-        return HTTPFormat.FORMAT_OGG
-    elif format == Format.FORMAT_FLAC:
-        return HTTPFormat.FORMAT_FLAC
-    elif format == Format.FORMAT_MULAW:
-        return HTTPFormat.FORMAT_MULAW
-    elif format == Format.FORMAT_PCM:
-        return HTTPFormat.FORMAT_PCM
-    else:
+    if not isinstance(format, Format):
         raise ValueError(f"Unsupported format for HTTP API: {format}")
+    return _HTTP_FORMATS[format.value]
 
 
 class Language(Enum):
@@ -133,6 +168,11 @@ class Language(Enum):
     URDU = "urdu"
     XHOSA = "xhosa"
 
+    @property
+    def identifier(self) -> int:
+        """Numeric language identifier used by the gRPC API."""
+        return self._identifier  # type: ignore[attr-defined]
+
 
 # https://github.com/playht/tts.cpp/blob/8adf892e1464069a9ce4b1b7639db962f1cd0deb/play_tts/parrot/parrot_params.py#L31-L73
 LanguageIdentifiers = {
@@ -176,6 +216,51 @@ LanguageIdentifiers = {
 }
 
 
+def _attach_language_identifiers():
+    # Store each identifier on its member so the request path doesn't hash the enum.
+    for language, identifier in LanguageIdentifiers.items():
+        language._identifier = identifier  # type: ignore[attr-defined]
+
+
+_attach_language_identifiers()
+
+
+# TTSOptions is mutable, so the template is keyed on the option values rather than cached on the instance.
+@functools.lru_cache(maxsize=64)
+def _tts_params_template(
+    voice: str,
+    format: Format,
+    sample_rate: Optional[int],
+    language: Optional[Language],
+    speed: float,
+    temperature: Optional[float],
+    top_p: Optional[float],
+    text_guidance: Optional[float],
+    voice_guidance: Optional[float],
+    seed: Optional[int],
+) -> api_pb2.TtsParams:
+    params = api_pb2.TtsParams(
+        voice=voice,
+        format=format.value,
+        quality=api_pb2.QUALITY_DRAFT,  # DEPRECATED (use sample rate to adjust audio quality)
+        sample_rate=sample_rate,
+        language_identifier=language.identifier if language is not None else None,
+        speed=speed,
+    )
+    # If the hyperparams are unset, let the proto fallback to default.
+    if temperature is not None:
+        params.temperature = temperature
+    if top_p is not None:
+        params.top_p = top_p
+    if text_guidance is not None:
+        params.text_guidance = text_guidance
+    if voice_guidance is not None:
+        params.voice_guidance = voice_guidance
+    if seed is not None:
+        params.seed = seed
+    return params
+
+
 @dataclass
 class TTSOptions:
     voice: str
@@ -216,97 +301,168 @@ class TTSOptions:
     quality: Optional[str] = None
 
     def tts_params(self, text: list[str], voice_engine: Optional[str]) -> api_pb2.TtsParams:
+        params = api_pb2.TtsParams()
+        self._fill_tts_params(params, text, voice_engine)
+        return params
 
+    def _fill_tts_params(self, params: api_pb2.TtsParams, text: list[str], voice_engine: Optional[str]):
+        # Writes into an existing message (e.g. TtsRequest.params) so the params aren't built and then copied.
         if voice_engine is None:
             voice_engine = "PlayHT2.0-turbo"
         elif voice_engine != "Play3.0-mini" and voice_engine != "PlayHT2.0-turbo":
             raise ValueError(f"gRPC API only supports PlayHT2.0-turbo, Play3.0-mini (on-prem only); got {voice_engine}")
 
-        language_identifier = None
-        if self.language is not None:
-            language_identifier = LanguageIdentifiers[self.language]
-        params = api_pb2.TtsParams(
-            text=text,
-            voice=self.voice,
-            format=self.format.value,
-            quality=api_pb2.QUALITY_DRAFT,  # DEPRECATED (use sample rate to adjust audio quality)
-            sample_rate=self.sample_rate,
-            language_identifier=language_identifier,
-            speed=self.speed,
-        )
-        # If the hyperparams are unset, let the proto fallback to default.
-        if self.temperature is not None:
-            params.temperature = self.temperature
-        if self.top_p is not None:
-            params.top_p = self.top_p
-        if self.text_guidance is not None:
-            params.text_guidance = self.text_guidance
-        if self.voice_guidance is not None:
-            params.voice_guidance = self.voice_guidance
-        if self.seed is not None:
-            params.seed = self.seed
-        return params
+        params.CopyFrom(_tts_params_template(self.voice, self.format, self.sample_rate, self.language, self.speed,
+                                             self.temperature, self.top_p, self.text_guidance, self.voice_guidance,
+                                             self.seed))
+        params.text.extend(text)
+
+
+_MIME_TYPES: Dict[Format, str] = {
+    Format.FORMAT_RAW: "audio/basic",
+    Format.FORMAT_MP3: "audio/mpeg",
+    Format.FORMAT_WAV: "audio/wav",
+    Format.FORMAT_OGG: "audio/ogg",
+    Format.FORMAT_FLAC: "audio/flac",
+    Format.FORMAT_MULAW: "audio/basic",
+}
 
 
 def output_format_to_mime_type(format: Format) -> str:
-    http_format = grpc_format_to_http_format(format)
-    if http_format == HTTPFormat.FORMAT_RAW:
-        return "audio/basic"
-    elif http_format == HTTPFormat.FORMAT_MP3:
-        return "audio/mpeg"
-    elif http_format == HTTPFormat.FORMAT_WAV:
-        return "audio/wav"
-    elif http_format == HTTPFormat.FORMAT_OGG:
-        return "audio/ogg"
-    elif http_format == HTTPFormat.FORMAT_FLAC:
-        return "audio/flac"
-    elif http_format == HTTPFormat.FORMAT_MULAW:
-        return "audio/basic"
-    else:
-        return "audio/mpeg"  # mp3 by default
+    return _MIME_TYPES.get(format, "audio/mpeg")  # mp3 by default
+
+
+# API version for each canonical voice engine (as returned by get_voice_engine_and_protocol).
+_API_VERSIONS: Dict[str, str] = {
+    "Play3.0-mini": "v3",
+    "PlayHT2.0-turbo": "v2",
+    "PlayDialog": "ldm",
+    "PlayDialogMultilingual": "ldm",
+}
+
+# Any other name (e.g. the "Play3.0" or "PlayDialog-http" aliases) is versioned by its family prefix.
+_API_VERSION_PREFIXES: Tuple[Tuple[str, str], ...] = (
+    ("Play3.0", "v3"),
+    ("PlayHT2.0", "v2"),
+    ("PlayDialog", "ldm"),
+)
 
 
 def http_prepare_dict(text: List[str], options: TTSOptions, voice_engine: str) -> Dict[str, Any]:
-    if voice_engine.startswith("Play3.0"):
-        version = "v3"
-    elif voice_engine.startswith("PlayHT2.0"):
-        version = "v2"
-    elif voice_engine.startswith("PlayDialog"):
-        version = "ldm"
-    else:
-        raise ValueError(f"Unknown voice engine: {voice_engine}")
-    return {
+    version = _API_VERSIONS.get(voice_engine)
+    if version is None:
+        for prefix, prefix_version in _API_VERSION_PREFIXES:
+            if voice_engine.startswith(prefix):
+                version = prefix_version
+                break
+        else:
+            raise ValueError(f"Unknown voice engine: {voice_engine}")
+    body: Dict[str, Any] = {
         "text": text,
         "voice": options.voice,
         "output_format": grpc_format_to_http_format(options.format).value,
         "speed": options.speed,
-        "sample_rate": options.sample_rate,
         "voice_engine": voice_engine,
-        **{k: v for k, v in {
-            "seed": options.seed,
-            "temperature": options.temperature,
-            "top_p": options.top_p,
-            "text_guidance": options.text_guidance,
-            "voice_guidance": options.voice_guidance,
-            "style_guidance": options.style_guidance,
-            "repetition_penalty": options.repetition_penalty,
-        }.items() if v is not None},
-        "language": options.language.value if options.language is not None else None,
         "version": version,
-
-        # PlayDialog and PlayDialogMultilingual
-        # leave the _2 params None if generating single-speaker audio
-        "voice_2": options.voice_2,
-        "turn_prefix": options.turn_prefix,
-        "turn_prefix_2": options.turn_prefix_2,
-        "voice_conditioning_seconds": options.voice_conditioning_seconds,
-        "voice_conditioning_seconds_2": options.voice_conditioning_seconds_2,
-        "scene_description": options.scene_description,
-        "turn_clip_description": options.turn_clip_description,
-        "num_candidates": options.num_candidates,
-        "candidate_ranking_method": options.candidate_ranking_method.value
-        if options.candidate_ranking_method is not None else None,
     }
+    # Unset options are omitted rather than sent as null, so the server applies its defaults.
+    if options.sample_rate is not None:
+        body["sample_rate"] = options.sample_rate
+    if options.seed is not None:
+        body["seed"] = options.seed
+    if options.temperature is not None:
+        body["temperature"] = options.temperature
+    if options.top_p is not None:
+        body["top_p"] = options.top_p
+    if options.text_guidance is not None:
+        body["text_guidance"] = options.text_guidance
+    if options.voice_guidance is not None:
+        body["voice_guidance"] = options.voice_guidance
+    if options.style_guidance is not None:
+        body["style_guidance"] = options.style_guidance
+    if options.repetition_penalty is not None:
+        body["repetition_penalty"] = options.repetition_penalty
+    if options.language is not None:
+        body["language"] = options.language.value
+
+    # PlayDialog and PlayDialogMultilingual
+    # leave the _2 params None if generating single-speaker audio
+    if options.voice_2 is not None:
+        body["voice_2"] = options.voice_2
+    if options.turn_prefix is not None:
+        body["turn_prefix"] = options.turn_prefix
+    if options.turn_prefix_2 is not None:
+        body["turn_prefix_2"] = options.turn_prefix_2
+    if options.voice_conditioning_seconds is not None:
+        body["voice_conditioning_seconds"] = options.voice_conditioning_seconds
+    if options.voice_conditioning_seconds_2 is not None:
+        body["voice_conditioning_seconds_2"] = options.voice_conditioning_seconds_2
+    if options.scene_description is not None:
+        body["scene_description"] = options.scene_description
+    if options.turn_clip_description is not None:
+        body["turn_clip_description"] = options.turn_clip_description
+    if options.num_candidates is not None:
+        body["num_candidates"] = options.num_candidates
+    if options.candidate_ranking_method is not None:
+        body["candidate_ranking_method"] = options.candidate_ranking_method.value
+    return body
+
+
+class _ChannelPool:
+    """Round-robin pool of gRPC channels (and their stubs) to a single address.
+
+    A channel multiplexes all of its streams over one HTTP/2 connection; spreading concurrent requests across
+    several channels avoids head-of-line blocking behind a single TCP connection.
+
+    Requests acquire() the pool for as long as they stream from it. A pool replaced by a lease refresh is
+    retire()d, and whichever of retire() and the last release() returns True tells its caller to close it, so
+    streams already running on it are not cut off.
+    """
+
+    def __init__(self, addr: str, channel_factory: Callable[[List[Tuple[str, Any]]], Any], size: int):
+        self.addr = addr
+        # A local subchannel pool keeps gRPC from collapsing identical channels onto one connection.
+        options = CLIENT_RETRY_OPTIONS + [("grpc.use_local_subchannel_pool", 1)]
+        self.channels = [channel_factory(options) for _ in range(max(1, size))]
+        self._stubs = [api_pb2_grpc.TtsStub(channel) for channel in self.channels]
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+        self._users = 0
+        self._retired = False
+        self._closing = False
+
+    def next_stub(self) -> api_pb2_grpc.TtsStub:
+        return self._stubs[next(self._next) % len(self._stubs)]
+
+    def acquire(self) -> bool:
+        """Registers a request on the pool; False if the pool is already being closed."""
+        with self._lock:
+            if self._closing:
+                return False
+            self._users += 1
+            return True
+
+    def release(self) -> bool:
+        """Ends a request on the pool; True if it was the last user of a retired pool."""
+        with self._lock:
+            self._users -= 1
+            return self._retired and self._close_if_unused()
+
+    def retire(self) -> bool:
+        """Marks the pool as replaced; True if no request is using it."""
+        with self._lock:
+            self._retired = True
+            return self._close_if_unused()
+
+    def _close_if_unused(self) -> bool:
+        if self._users or self._closing:
+            return False
+        self._closing = True
+        return True
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
 
 
 class CongestionCtrl(Enum):
@@ -317,7 +473,8 @@ class CongestionCtrl(Enum):
     # The client will not do any congestion control.
     OFF = 0
 
-    # The client will retry requests to the primary address up to two times with a 50ms backoff between attempts.
+    # The client will retry requests to the primary address up to two times, backing off exponentially (with jitter)
+    # from 50ms between attempts.
     #
     # Then it will fall back to the fallback address (if one is configured).  No retry attempts will be made
     # against the fallback address.
@@ -326,6 +483,72 @@ class CongestionCtrl(Enum):
     STATIC_MAR_2023 = 1
 
 
+# Building credentials loads and parses the root CA bundle; every secure channel can share one instance.
+@functools.lru_cache(maxsize=1)
+def _ssl_credentials() -> grpc.ChannelCredentials:
+    return ssl_channel_credentials()
+
+
+# A single worker keeps lease cache writes in order.
+_LEASE_CACHE_WRITER = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="lease-cache")
+
+
+class _RefreshScheduler:
+    """Runs the lease and coordinate refreshes and keepalives of every Client from one daemon thread, soonest first.
+
+    Entries hold only a weak reference to their callback's client, so a pending refresh doesn't keep an unused
+    Client alive. Callbacks are called with the token that schedule() returned for them, on a small worker pool:
+    one client's slow lease fetch must not hold up everyone else's.
+    """
+    def __init__(self, max_workers: int = 4):
+        self._heap: List[Tuple[float, int, weakref.WeakMethod]] = []
+        self._cancelled: Set[int] = set()
+        self._tokens = itertools.count()
+        self._cv = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._workers = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                              thread_name_prefix="lease-refresh")
+
+    def schedule(self, callback: Callable[[int], None], delay: float) -> int:
+        token = next(self._tokens)
+        with self._cv:
+            heapq.heappush(self._heap, (time.monotonic() + delay, token, weakref.WeakMethod(callback)))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="lease-refresh", daemon=True)
+                self._thread.start()
+            self._cv.notify()
+        return token
+
+    def cancel(self, token: int):
+        # The entry stays in the heap and is dropped when it comes due, rather than rebuilding the heap here.
+        with self._cv:
+            self._cancelled.add(token)
+
+    def _run(self):
+        while True:
+            with self._cv:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    self._cv.wait(self._heap[0][0] - time.monotonic() if self._heap else None)
+                _, token, ref = heapq.heappop(self._heap)
+                if token in self._cancelled:
+                    self._cancelled.discard(token)
+                    continue
+            callback = ref()
+            if callback is not None:
+                try:
+                    self._workers.submit(callback, token)
+                except RuntimeError:  # the interpreter is shutting down
+                    return
+            del callback
+
+
+_REFRESH_SCHEDULER = _RefreshScheduler()
+
+# Inference coordinates are refetched in the background this many seconds before requests would start refetching
+# them; a refresh is also never scheduled sooner than this, so a short-lived response can't make it spin.
+_COORDINATES_REFRESH_MARGIN = 10.0
+
+
 class Client:
     LEASE_DATA: Optional[bytes] = None
     LEASE_CACHE_PATH: str = os.path.join(tempfile.gettempdir(), 'playht.temporary.lease')
@@ -337,9 +560,14 @@ class Client:
         congestion_ctrl: CongestionCtrl = CongestionCtrl.OFF
         metrics_buffer_size: int = 1000
         remove_ssml_tags: bool = False
+        # Seconds between no-op requests that keep idle HTTP connections warm; None disables them.
+        keepalive_interval: Optional[float] = 60.0
+        # Threads shared by get_stream_pair listeners; get_stream_pair raises while this many are still running.
+        max_stream_pairs: int = 32
 
         # gRPC (PlayHT2.0-turbo and Play3.0-mini-grpc)
         grpc_addr: Optional[str] = None
+        grpc_channel_pool_size: int = 4
         insecure: bool = False
         fallback_enabled: bool = False
         auto_refresh_lease: bool = True
@@ -361,13 +589,13 @@ class Client:
         self._advanced = advanced or self.AdvancedOptions()
 
         def lease_factory() -> Lease:
-            _factory = LeaseFactory(user_id, api_key, self._advanced.api_url)
+            _factory = LeaseFactory(user_id, api_key, self._advanced.api_url, self._http)
             if self._advanced.disable_lease_disk_cache:
                 return _factory()
             maybe_data = self._lease_cache_read()
             if maybe_data is not None:
                 lease = Lease(maybe_data)
-                if lease.expires > datetime.now() + timedelta(minutes=5):
+                if lease.valid_for(timedelta(minutes=5)):
                     return lease
             lease = _factory()
             self._lease_cache_write(lease.data)
@@ -375,15 +603,33 @@ class Client:
 
         self._lease_factory = lease_factory
         self._lease: Optional[Lease] = None
-        self._rpc: Optional[Tuple[str, Channel]] = None
-        self._fallback_rpc: Optional[Tuple[str, Channel]] = None
+        self._rpc: Optional[_ChannelPool] = None
+        self._fallback_rpc: Optional[_ChannelPool] = None
+        # (lease, rpc) published together by refresh_lease so the gRPC path can read both without taking the lock.
+        self._grpc_session: Optional[Tuple[Lease, _ChannelPool]] = None
         self._lock = threading.Lock()
-        self._timer: Optional[threading.Timer] = None
+        self._refresh_token: Optional[int] = None
+        # Set while a lease refresh is in flight; concurrent refresh_lease() calls wait on it instead of fetching.
+        self._lease_refresh: Optional[concurrent.futures.Future] = None
+        self._keepalive_token: Optional[int] = None
+        self._coordinates_refresh_token: Optional[int] = None
+        # Set by close(); retry backoffs wait on it so closing the client interrupts them.
+        self._closed = threading.Event()
+        self._listen_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self._advanced.max_stream_pairs,
+                                                                  thread_name_prefix="listen-thread")
+        # One slot per listener thread, so a stream pair is refused rather than queued behind busy listeners.
+        self._listen_slots = threading.BoundedSemaphore(self._advanced.max_stream_pairs)
         self._telemetry = Telemetry(self._advanced.metrics_buffer_size)
         self._user_id = user_id
         self._api_key = api_key
         self._inference_coordinates: Optional[Dict[str, Any]] = None
+        self._coordinates_refresh_at = 0.0
         self._ws: Optional[ClientConnection] = None
+        self._ws_lock = threading.Lock()
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
 
         if self._advanced.congestion_ctrl == CongestionCtrl.STATIC_MAR_2023:
             self._max_attempts = 3
@@ -391,14 +637,16 @@ class Client:
         else:
             self._max_attempts = 1
             self._backoff = 0
+        self._backoff_schedule = _backoff_schedule(self._max_attempts, self._backoff)
 
         if auto_connect:
             self.refresh_lease()
             self.warmup()
+            self._schedule_keepalive()
 
     def ensure_inference_coordinates(self, force: bool = False):
         if self._inference_coordinates is None or \
-                self._inference_coordinates["refresh_at_ms"] < time.time_ns() // 1000000 or \
+                self._coordinates_refresh_at < time.monotonic() or \
                 force:
             if self._advanced.inference_coordinates_options.coordinates_generator_function is not None:
                 self._inference_coordinates = self._advanced.inference_coordinates_options.\
@@ -406,103 +654,216 @@ class Client:
                                                    self._advanced.inference_coordinates_options)
             else:
                 self._inference_coordinates = get_coordinates(self._user_id, self._api_key,
-                                                              self._advanced.inference_coordinates_options)
+                                                              self._advanced.inference_coordinates_options,
+                                                              session=self._http, force=force)
+
+            # refresh_at_ms is wall-clock; convert it once to a monotonic deadline.
+            self._coordinates_refresh_at = time.monotonic() + \
+                (self._inference_coordinates["refresh_at_ms"] - time.time() * 1000) / 1000
+            self._schedule_coordinates_refresh()
 
         assert self._inference_coordinates is not None, "No connection"
 
+    def _schedule_coordinates_refresh(self, refresh_in: Optional[float] = None):
+        if refresh_in is None:
+            refresh_in = max(_COORDINATES_REFRESH_MARGIN,
+                             self._coordinates_refresh_at - time.monotonic() - _COORDINATES_REFRESH_MARGIN)
+        with self._lock:
+            if self._closed.is_set():
+                return
+            if self._coordinates_refresh_token is not None:
+                _REFRESH_SCHEDULER.cancel(self._coordinates_refresh_token)
+            self._coordinates_refresh_token = _REFRESH_SCHEDULER.schedule(self._scheduled_coordinates_refresh,
+                                                                          refresh_in)
+
+    def _scheduled_coordinates_refresh(self, token: int):
+        with self._lock:
+            if self._closed.is_set() or token != self._coordinates_refresh_token:
+                return
+            self._coordinates_refresh_token = None
+        try:
+            # Reschedules itself from the new refresh_at, so requests never wait on /sdk-auth at the deadline.
+            self.ensure_inference_coordinates(force=True)
+        except Exception as e:
+            logging.warning(f"Failed to refresh inference coordinates, retrying in 30s: {e}")
+            self._schedule_coordinates_refresh(30)
+
     def warmup(self):
         self.ensure_inference_coordinates()
 
         try:
             assert self._inference_coordinates is not None, "No connection"
-            requests.options(self._inference_coordinates["Play3.0-mini"]["http_streaming_url"],
-                             headers={"Origin": "https://play.ht",
-                                      "Access-Control-Request-Method": "POST"})
+            self._http.options(self._inference_coordinates["Play3.0-mini"]["http_streaming_url"],
+                               headers={"Origin": "https://play.ht",
+                                        "Access-Control-Request-Method": "POST"})
         except Exception as e:
             logging.warning(f"Failed to warmup: {e}")
 
+    def _schedule_keepalive(self):
+        if not self._advanced.keepalive_interval:
+            return
+        with self._lock:
+            if not self._closed.is_set():
+                self._keepalive_token = _REFRESH_SCHEDULER.schedule(self._keepalive,
+                                                                    self._advanced.keepalive_interval)
+
+    def _keepalive(self, token: int):
+        with self._lock:
+            if self._closed.is_set() or token != self._keepalive_token:
+                return
+            self._keepalive_token = None
+        try:
+            # The coordinates are renewed ahead of time by their own scheduled refresh; this just pings.
+            self.warmup()
+        except Exception as e:
+            logging.debug(f"Keepalive failed: {e}")
+        self._schedule_keepalive()
+
     @classmethod
     def _lease_cache_read(cls) -> Optional[bytes]:
         with cls.LEASE_LOCK:
             if cls.LEASE_DATA is not None:
                 return cls.LEASE_DATA
-            try:
-                with filelock.FileLock(cls.LEASE_CACHE_PATH + '.lock'):
-                    if not os.path.exists(cls.LEASE_CACHE_PATH):
-                        return None
-                    with open(cls.LEASE_CACHE_PATH, 'rb') as fp:
-                        return fp.read()
-            except IOError:
-                return None
+        # Writers replace the file atomically, so a miss can read it without holding either lock.
+        try:
+            with open(cls.LEASE_CACHE_PATH, 'rb') as fp:
+                return fp.read()
+        except IOError:  # includes FileNotFoundError when nothing has been cached yet
+            return None
 
     @classmethod
     def _lease_cache_write(cls, data: bytes):
         with cls.LEASE_LOCK:
             cls.LEASE_DATA = data
-            try:
-                with filelock.FileLock(cls.LEASE_CACHE_PATH + '.lock'):
-                    with open(cls.LEASE_CACHE_PATH, 'wb') as fp:
-                        fp.write(data)
-            except IOError:
-                return
+        # Readers in this process are served from LEASE_DATA, so the disk write can happen off the request thread.
+        _LEASE_CACHE_WRITER.submit(cls._lease_cache_write_file, data)
 
-    def _schedule_refresh(self):
+    @classmethod
+    def _lease_cache_write_file(cls, data: bytes):
+        try:
+            # Write a temporary file and rename it over the cache so readers never see a partial lease.
+            tmp_path = f"{cls.LEASE_CACHE_PATH}.{os.getpid()}.tmp"
+            with filelock.FileLock(cls.LEASE_CACHE_PATH + '.lock'):
+                with open(tmp_path, 'wb') as fp:
+                    fp.write(data)
+                os.replace(tmp_path, cls.LEASE_CACHE_PATH)
+        except IOError:
+            return
+
+    def _schedule_refresh(self, refresh_in: Optional[float] = None):
         assert self._lock.locked
-        if self._lease is None:
-            refresh_in = timedelta(minutes=4, seconds=45).total_seconds()
-        else:
-            refresh_in = (
-                self._lease.expires - timedelta(minutes=5) - datetime.now()
-            ).total_seconds()
-        self._timer = threading.Timer(refresh_in, self.refresh_lease)
-        self._timer.start()
+        if self._refresh_token is not None:
+            _REFRESH_SCHEDULER.cancel(self._refresh_token)
+        if refresh_in is None:
+            if self._lease is None:
+                refresh_in = timedelta(minutes=4, seconds=45).total_seconds()
+            else:
+                refresh_in = max(0.0, self._lease.seconds_until(timedelta(minutes=5)))
+        self._refresh_token = _REFRESH_SCHEDULER.schedule(self._scheduled_refresh, refresh_in)
+
+    def _scheduled_refresh(self, token: int):
+        with self._lock:
+            if self._closed.is_set() or token != self._refresh_token:
+                return
+            self._refresh_token = None
+        try:
+            self.refresh_lease()
+        except Exception as e:
+            logging.warning(f"Failed to refresh lease, retrying in 30s: {e}")
+            with self._lock:
+                if not self._closed.is_set() and self._refresh_token is None:
+                    self._schedule_refresh(30)
+
+    def _channel_pool(self, addr: str, insecure: bool) -> _ChannelPool:
+        def channel_factory(options: List[Tuple[str, Any]]) -> Channel:
+            if insecure:
+                return insecure_channel(addr, options=options)
+            return secure_channel(addr, _ssl_credentials(), options=options)
+        return _ChannelPool(addr, channel_factory, self._advanced.grpc_channel_pool_size)
 
     def refresh_lease(self):
         """Manually refresh credentials with Play."""
         with self._lock:
-            if self._lease and self._lease.expires > datetime.now() + timedelta(minutes=5):
-                if self._advanced.auto_refresh_lease and self._timer is None:
+            if self._closed.is_set():
+                raise RuntimeError("Client is closed")
+            if self._lease and self._lease.valid_for(timedelta(minutes=5)):
+                if self._advanced.auto_refresh_lease and self._refresh_token is None:
                     self._schedule_refresh()
                 return
-            self._lease = self._lease_factory()
-
-            grpc_addr = self._advanced.grpc_addr or self._lease.metadata["inference_address"]
-
-            if self._rpc and self._rpc[0] != grpc_addr:
-                self._rpc[1].close()
-                self._rpc = None
-            if not self._rpc:
-                insecure = self._advanced.insecure or "on-prem.play.ht" in grpc_addr
-                channel = (
-                    insecure_channel(grpc_addr, options=CLIENT_RETRY_OPTIONS) if insecure
-                    else secure_channel(grpc_addr, ssl_channel_credentials(), options=CLIENT_RETRY_OPTIONS)
-                )
-                self._rpc = (grpc_addr, channel)
-
-            # Maybe set up a fallback grpc client
-            if self._advanced.fallback_enabled:
-                # Choose the fallback address
-                # For now, this always is the inference address in the lease, but we can extend in the future
-                fallback_addr = self._lease.metadata["inference_address"]
-
-                # Only do fallback if the fallback address is not the same as the primary address
-                if grpc_addr != fallback_addr:
-                    if self._fallback_rpc and self._fallback_rpc[0] != fallback_addr:
-                        self._fallback_rpc[1].close()
-                        self._fallback_rpc = None
-                    if not self._fallback_rpc:
-                        channel = (
-                            insecure_channel(fallback_addr, options=CLIENT_RETRY_OPTIONS) if self._advanced.insecure
-                            else secure_channel(fallback_addr, ssl_channel_credentials(), options=CLIENT_RETRY_OPTIONS)
-                        )
-                        self._fallback_rpc = (fallback_addr, channel)
-
-            if self._timer:
-                self._timer.cancel()
+            inflight = self._lease_refresh
+            fetching = inflight is None
+            if fetching:
+                inflight = self._lease_refresh = concurrent.futures.Future()
+        if not fetching:
+            inflight.result()
+            return
+
+        try:
+            self._refresh_lease()
+        except BaseException as e:
+            with self._lock:
+                self._lease_refresh = None
+            inflight.set_exception(e)
+            raise
+        with self._lock:
+            self._lease_refresh = None
+        inflight.set_result(None)
+
+    def _refresh_lease(self):
+        with self._lock:
+            rpc, fallback_rpc = self._rpc, self._fallback_rpc
+
+        # Fetch the lease and build any new channels outside the lock; only the swap below is locked.
+        lease = self._lease_factory()
+
+        grpc_addr = self._advanced.grpc_addr or lease.metadata["inference_address"]
+
+        # The lease travels with each request, not the channel, so a rotated lease keeps the existing pool and its
+        # HTTP/2 connections. Channels are rebuilt only when the inference address actually moves.
+        new_rpc = None
+        if not rpc or rpc.addr != grpc_addr:
+            insecure = self._advanced.insecure or "on-prem.play.ht" in grpc_addr
+            new_rpc = self._channel_pool(grpc_addr, insecure)
+
+        # Maybe set up a fallback grpc client
+        new_fallback_rpc = None
+        if self._advanced.fallback_enabled:
+            # Choose the fallback address
+            # For now, this always is the inference address in the lease, but we can extend in the future
+            fallback_addr = lease.metadata["inference_address"]
+
+            # Only do fallback if the fallback address is not the same as the primary address
+            if grpc_addr != fallback_addr and (not fallback_rpc or fallback_rpc.addr != fallback_addr):
+                new_fallback_rpc = self._channel_pool(fallback_addr, self._advanced.insecure)
+
+        stale: List[_ChannelPool] = []
+        with self._lock:
+            if self._closed.is_set():
+                # close() ran while the lease was being fetched; don't bring back the channels it shut down.
+                for pool in (new_rpc, new_fallback_rpc):
+                    if pool is not None:
+                        pool.close()
+                raise RuntimeError("Client is closed")
+            self._lease = lease
+            if new_rpc is not None:
+                if self._rpc:
+                    stale.append(self._rpc)
+                self._rpc = new_rpc
+            if new_fallback_rpc is not None:
+                if self._fallback_rpc:
+                    stale.append(self._fallback_rpc)
+                self._fallback_rpc = new_fallback_rpc
+            if self._rpc is not None:
+                self._grpc_session = (lease, self._rpc)
 
             if self._advanced.auto_refresh_lease:
                 self._schedule_refresh()
 
+        # Pools still streaming are closed by their last request instead.
+        for pool in stale:
+            if pool.retire():
+                pool.close()
+
     def stream_tts_input(
         self,
         text_stream: Union[Generator[str, None, None], Iterable[str]],
@@ -512,18 +873,17 @@ class Client:
         streaming: bool = True
     ) -> Iterable[bytes]:
         """Stream input to Play.ht via the text_stream object."""
-        buffer = io.StringIO()
+        parts: List[str] = []
         for text in text_stream:
             t = text.strip()
-            buffer.write(t)
-            buffer.write(" ")  # normalize word spacing.
-            if SENTENCE_END_REGEX.match(t) is None:
+            parts.append(t)  # words are re-joined with single spaces to normalize spacing.
+            if not is_sentence_end(t):
                 continue
-            yield from self.tts(buffer.getvalue(), options, voice_engine, protocol, streaming)
-            buffer = io.StringIO()
+            yield from self.tts(" ".join(parts), options, voice_engine, protocol, streaming)
+            parts.clear()
         # If text_stream closes, send all remaining text, regardless of sentence structure.
-        if buffer.tell() > 0:
-            yield from self.tts(buffer.getvalue(), options, voice_engine, protocol, streaming)
+        if parts:
+            yield from self.tts(" ".join(parts), options, voice_engine, protocol, streaming)
 
     def tts(
             self,
@@ -566,70 +926,93 @@ class Client:
             raise ValueError(f"Only {supported_voice_engines} are supported in the gRPC API; got {voice_engine}")
 
         start = time.perf_counter()
-        self.refresh_lease()
-        with self._lock:
-            assert self._lease is not None and self._rpc is not None, "No connection"
-            lease_data = self._lease.data
-
-        text = prepare_text(text, self._advanced.remove_ssml_tags)
-        metrics.append("text", str(text)).append("endpoint", str(self._rpc[0]))
-
+        audio_begins_at = _audio_begins_at(options.format)
         if options.format == Format.FORMAT_PCM:
             raise ValueError("PCM format is not supported in the gRPC API")
-        request = api_pb2.TtsRequest(params=options.tts_params(text, voice_engine), lease=lease_data)
-
-        for attempt in range(1, self._max_attempts + 1):
-            try:
-                stub = api_pb2_grpc.TtsStub(self._rpc[1])
-                stream = stub.Tts(request)  # type: Iterable[api_pb2.TtsResponse]
-                chunk_idx = -1
-                for chunk in stream:
-                    chunk_idx += 1
-                    if chunk_idx == _audio_begins_at(options.format):
-                        metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
-                    yield chunk.data
-                metrics.finish_ok()
+        while True:
+            session = self._grpc_session
+            if session is None or not session[0].valid_for(timedelta(minutes=5)):
+                self.refresh_lease()
+                session = self._grpc_session
+            assert session is not None, "No connection"
+            lease, rpc = session
+            # A refresh may have retired and closed this pool since it was read; then use its replacement.
+            if rpc.acquire():
                 break
-            except grpc.RpcError as e:
-                error_code = getattr(e, "code")()
-                logging.debug(f"Error: {error_code}")
-                if error_code not in {StatusCode.RESOURCE_EXHAUSTED, StatusCode.UNAVAILABLE}:
-                    metrics.finish_error(str(e))
-                    raise
+        fallback_rpc = self._fallback_rpc
+        if fallback_rpc is not None and not fallback_rpc.acquire():
+            fallback_rpc = None
+        lease_data = lease.data
 
-                if attempt < self._max_attempts:
-                    # It's poor customer experience to show internal details about retries, so we only debug log here.
-                    logging.debug(f"Retrying in {self._backoff*1000} ms ({attempt} attempts so far); ({error_code})")
-                    metrics.inc("retry").append("retry.reason", str(error_code))
-                    metrics.start_timer("retry-backoff")
-                    if self._backoff > 0:
-                        time.sleep(self._backoff)
-                    metrics.finish_timer("retry-backoff")
-                    continue
+        try:
+            text = prepare_text(text, self._advanced.remove_ssml_tags)
+            metrics.append("text", text).append("endpoint", str(rpc.addr))
 
-                if self._fallback_rpc is None:
-                    metrics.finish_error(str(e))
-                    raise
+            request = api_pb2.TtsRequest(lease=lease_data)
+            options._fill_tts_params(request.params, text, voice_engine)
 
-                # We log fallbacks to give customers an extra signal that they should scale up their on-prem appliance
-                # (e.g. by paying for more GPU quota)
-                logging.info(f"Falling back to {self._fallback_rpc[0]} because {self._rpc[0]} threw: {error_code}")
-                metrics.inc("fallback").append("fallback.reason", str(error_code))
+            for attempt in range(1, self._max_attempts + 1):
                 try:
-                    metrics.append("text", str(request.params.text)).append("endpoint", str(self._fallback_rpc[0]))
-                    stub = api_pb2_grpc.TtsStub(self._fallback_rpc[1])
-                    stream = stub.Tts(request)  # type: Iterable[api_pb2.TtsResponse]
+                    stream = rpc.next_stub().Tts(request)  # type: Iterable[api_pb2.TtsResponse]
                     chunk_idx = -1
                     for chunk in stream:
-                        chunk_idx += 1
-                        if chunk_idx == _audio_begins_at(options.format):
-                            metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
+                        # Only the first few chunks need counting; afterwards this is a single comparison.
+                        if chunk_idx < audio_begins_at:
+                            chunk_idx += 1
+                            if chunk_idx == audio_begins_at:
+                                metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
                         yield chunk.data
                     metrics.finish_ok()
                     break
-                except grpc.RpcError as fallback_e:
-                    metrics.finish_error(str(fallback_e))
-                    raise fallback_e from e
+                except grpc.RpcError as e:
+                    error_code = getattr(e, "code")()
+                    logging.debug(f"Error: {error_code}")
+                    if error_code not in _RETRYABLE_STATUS_CODES:
+                        metrics.finish_error(str(e))
+                        raise
+
+                    if attempt < self._max_attempts:
+                        # It's poor customer experience to show internal details about retries, so we only debug log
+                        # here.
+                        backoff = self._backoff_schedule[attempt - 1]
+                        logging.debug(f"Retrying in {backoff*1000} ms ({attempt} attempts so far); ({error_code})")
+                        metrics.inc("retry").append("retry.reason", str(error_code))
+                        if backoff > 0:
+                            metrics.start_timer("retry-backoff")
+                            closed = self._closed.wait(backoff)
+                            metrics.finish_timer("retry-backoff")
+                            if closed:
+                                metrics.finish_error(str(e))
+                                raise
+                        continue
+
+                    if fallback_rpc is None:
+                        metrics.finish_error(str(e))
+                        raise
+
+                    # We log fallbacks to give customers an extra signal that they should scale up their on-prem
+                    # appliance (e.g. by paying for more GPU quota)
+                    logging.info(f"Falling back to {fallback_rpc.addr} because {rpc.addr} threw: {error_code}")
+                    metrics.inc("fallback").append("fallback.reason", str(error_code))
+                    try:
+                        metrics.append("endpoint", str(fallback_rpc.addr))
+                        stream = fallback_rpc.next_stub().Tts(request)  # type: Iterable[api_pb2.TtsResponse]
+                        chunk_idx = -1
+                        for chunk in stream:
+                            if chunk_idx < audio_begins_at:
+                                chunk_idx += 1
+                                if chunk_idx == audio_begins_at:
+                                    metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
+                            yield chunk.data
+                        metrics.finish_ok()
+                        break
+                    except grpc.RpcError as fallback_e:
+                        metrics.finish_error(str(fallback_e))
+                        raise fallback_e from e
+        finally:
+            for pool in (rpc, fallback_rpc):
+                if pool is not None and pool.release():
+                    pool.close()
 
     def _tts_http(
             self,
@@ -644,54 +1027,63 @@ class Client:
             raise ValueError(f"Only {supported_voice_engines} are supported in the HTTP API; got {voice_engine}")
 
         start = time.perf_counter()
+        audio_begins_at = _audio_begins_at(options.format)
         self.ensure_inference_coordinates()
         assert self._inference_coordinates is not None, "No connection"
 
-        if streaming:
-            url = self._inference_coordinates[voice_engine]["http_streaming_url"]
-        else:
-            url = self._inference_coordinates[voice_engine]["http_nonstreaming_url"]
+        url_key = "http_streaming_url" if streaming else "http_nonstreaming_url"
+        url = self._inference_coordinates[voice_engine][url_key]
 
         text = prepare_text(text, self._advanced.remove_ssml_tags)
-        metrics.append("text", str(text)).append("endpoint", str(url))
+        metrics.append("text", text).append("endpoint", str(url))
+        body = http_prepare_dict(text, options, voice_engine)
 
         for attempt in range(1, self._max_attempts + 1):
             try:
-                assert self._inference_coordinates is not None, "No connection"
-                response = requests.post(
+                # Closing the streamed response on every exit path hands its connection back to the pool.
+                with self._http.post(
                         url,
                         headers={
                             "accept": output_format_to_mime_type(options.format),
                         },
-                        json=http_prepare_dict(text, options, voice_engine),
+                        json=body,
                         stream=True
-                    )
-                if response.status_code != 200:
-                    raise Exception(f"HTTP {response.status_code}: {response.text}", response.status_code)
-                chunk_idx = -1
-                for chunk in response.iter_content(chunk_size=None):
-                    chunk_idx += 1
-                    if chunk_idx == _audio_begins_at(options.format):
-                        metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
-                    yield chunk
+                ) as response:
+                    if response.status_code != 200:
+                        error_body = response.raw.read(MAX_ERROR_BODY_BYTES, decode_content=True)
+                        raise Exception(f"HTTP {response.status_code}: {error_body.decode(errors='replace')}",
+                                        response.status_code)
+                    chunk_idx = -1
+                    for chunk in response.iter_content(chunk_size=None):
+                        if chunk_idx < audio_begins_at:
+                            chunk_idx += 1
+                            if chunk_idx == audio_begins_at:
+                                metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
+                        yield chunk
                 metrics.finish_ok()
                 break
             except Exception as e:
                 logging.debug(f"Error: {e}")
                 if e.args[1] == "401":
-                    self.ensure_inference_coordinates()
+                    self.ensure_inference_coordinates(force=True)
+                    assert self._inference_coordinates is not None, "No connection"
+                    url = self._inference_coordinates[voice_engine][url_key]
                 elif e.args[1] not in {429, 503}:  # HTTP equivalent to gRPC RESOURCE_EXHAUSTED, UNAVAILABLE
                     metrics.finish_error(str(e))
                     raise
 
                 if attempt < self._max_attempts:
                     # It's poor customer experience to show internal details about retries, so we only debug log here.
-                    logging.debug(f"Retrying in {self._backoff*1000} ms ({attempt} attempts so far); ({e.args[1]})")
+                    backoff = self._backoff_schedule[attempt - 1]
+                    logging.debug(f"Retrying in {backoff*1000} ms ({attempt} attempts so far); ({e.args[1]})")
                     metrics.inc("retry").append("retry.reason", str(e.args[1]))
-                    metrics.start_timer("retry-backoff")
-                    if self._backoff > 0:
-                        time.sleep(self._backoff)
-                    metrics.finish_timer("retry-backoff")
+                    if backoff > 0:
+                        metrics.start_timer("retry-backoff")
+                        closed = self._closed.wait(backoff)
+                        metrics.finish_timer("retry-backoff")
+                        if closed:
+                            metrics.finish_error(str(e))
+                            raise
                     continue
 
                 metrics.finish_error(str(e))
@@ -709,54 +1101,77 @@ class Client:
             raise ValueError(f"Only {supported_voice_engines} are supported in the WebSocket API; got {voice_engine}")
 
         start = time.perf_counter()
+        audio_begins_at = _audio_begins_at(options.format)
         self.ensure_inference_coordinates()
 
         text = prepare_text(text, self._advanced.remove_ssml_tags)
         assert self._inference_coordinates is not None, "No connection"
-        metrics.append("text", str(text)).append("endpoint",
-                                                 str(self._inference_coordinates[voice_engine]["websocket_url"]))
+        ws_address = self._inference_coordinates[voice_engine]["websocket_url"]
+        metrics.append("text", text).append("endpoint", str(ws_address))
         request_id = str(uuid.uuid4())
         json_data = http_prepare_dict(text, options, voice_engine)
         json_data["request_id"] = request_id
+        payload = json_dumps(json_data)  # sent as a text frame
 
         for attempt in range(1, self._max_attempts + 1):
             try:
-                assert self._inference_coordinates is not None, "No connection"
-                ws_address = self._inference_coordinates[voice_engine]["websocket_url"]
-                if self._ws is None:
-                    self._ws = connect(ws_address)
+                # Take the idle socket for the whole request, so concurrent (or nested) requests open their own
+                # rather than interleaving frames on it. It's handed back only once its response has been read
+                # to the end; a request that fails or is abandoned part-way closes it instead.
+                with self._ws_lock:
+                    ws, self._ws = self._ws, None
+                finished = False
                 try:
-                    self._ws.send(json.dumps(json_data))
-                except ConnectionClosed as e:
-                    logging.debug(f"Reconnecting websocket which closed unexpectedly: {e}")
-                    self._ws = connect(ws_address)
-                    self._ws.send(json.dumps(json_data))
-                chunk_idx = -1
-                for chunk in self._ws:
-                    chunk_idx += 1
-                    if isinstance(chunk, str):
-                        msg = json.loads(chunk)
-                        if msg["type"] == "end":
-                            break
-                        else:
-                            continue
-                    elif chunk_idx == _audio_begins_at(options.format):
-                        metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
-                    yield chunk
+                    if ws is None:
+                        ws = connect(ws_address, open_timeout=WS_OPEN_TIMEOUT)
+                    try:
+                        ws.send(payload)
+                    except ConnectionClosed as e:
+                        logging.debug(f"Reconnecting websocket which closed unexpectedly: {e}")
+                        ws = connect(ws_address, open_timeout=WS_OPEN_TIMEOUT)
+                        ws.send(payload)
+                    chunk_idx = -1
+                    for chunk in ws:
+                        if chunk_idx < audio_begins_at:
+                            chunk_idx += 1
+                            if chunk_idx == audio_begins_at and not isinstance(chunk, str):
+                                metrics.set_timer("time-to-first-audio", time.perf_counter() - start)
+                        if isinstance(chunk, str):
+                            msg = json.loads(chunk)
+                            if msg["type"] == "end":
+                                finished = True
+                                break
+                            else:
+                                continue
+                        yield chunk
+                finally:
+                    if ws is not None and finished:
+                        with self._ws_lock:
+                            if self._ws is None and not self._closed.is_set():
+                                self._ws, ws = ws, None
+                    if ws is not None:
+                        ws.close()
                 metrics.finish_ok()
                 break
             except Exception as e:
                 logging.debug(f"Error: {e}")
                 if attempt < self._max_attempts:
+                    reason = e.args[1] if len(e.args) > 1 else type(e).__name__
                     # It's poor customer experience to show internal details about retries, so we only debug log here.
-                    logging.debug(f"Retrying in {self._backoff*1000} ms ({attempt} attempts so far); ({e.args[1]})")
-                    metrics.inc("retry").append("retry.reason", str(e.args[1]))
-                    metrics.start_timer("retry-backoff")
-                    if self._backoff > 0:
-                        time.sleep(self._backoff)
-                    metrics.finish_timer("retry-backoff")
+                    backoff = self._backoff_schedule[attempt - 1]
+                    logging.debug(f"Retrying in {backoff*1000} ms ({attempt} attempts so far); ({reason})")
+                    metrics.inc("retry").append("retry.reason", str(reason))
+                    if backoff > 0:
+                        metrics.start_timer("retry-backoff")
+                        closed = self._closed.wait(backoff)
+                        metrics.finish_timer("retry-backoff")
+                        if closed:
+                            metrics.finish_error(str(e))
+                            raise
                     # In case it was an expired token, refresh it
                     self.ensure_inference_coordinates(force=True)
+                    assert self._inference_coordinates is not None, "No connection"
+                    ws_address = self._inference_coordinates[voice_engine]["websocket_url"]
                     continue
                 metrics.finish_error(str(e))
                 raise
@@ -765,56 +1180,136 @@ class Client:
         self,
         options: TTSOptions,
         voice_engine: Optional[str] = None,
-        protocol: Optional[str] = None
+        protocol: Optional[str] = None,
+        threaded: bool = True,
+        max_buffered_chunks: int = 0
     ) -> Tuple['_InputStream', '_OutputStream']:
         """Get a linked pair of (input, output) streams.
 
         These stream objects are thread-aware and safe to use in separate threads.
+
+        max_buffered_chunks > 0 bounds the audio buffered between the streams: the listener stops reading from
+        the network until the output is consumed, so the output must be read while input is still being written.
+
+        With threaded=False no listener thread is started: iterating the output stream drives the requests
+        directly, saving a thread hop per audio chunk. The input must then be fed from another thread, or
+        written (and done() called) before the output is read.
         """
-        shared_q = queue.Queue()
+        if not threaded:
+            input_stream = _InputStream(self, options, None, voice_engine, protocol)
+            output = self.stream_tts_input(input_stream._input, options, voice_engine, protocol)
+            return input_stream, _GeneratorOutputStream(iter(output))
+        shared_q = _SpscQueue(max_buffered_chunks)
         return (
             _InputStream(self, options, shared_q, voice_engine, protocol),
             _OutputStream(shared_q)
         )
 
     def close(self):
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
-        if self._rpc:
-            self._rpc[1].close()
-            self._rpc = None
-        if self._fallback_rpc:
-            self._fallback_rpc[1].close()
-            self._fallback_rpc = None
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+            for token in (self._refresh_token, self._keepalive_token, self._coordinates_refresh_token):
+                if token is not None:
+                    _REFRESH_SCHEDULER.cancel(token)
+            self._refresh_token = self._keepalive_token = self._coordinates_refresh_token = None
+        self._grpc_session = None
+        # Requests already streaming finish on their pools, which the last of them then closes.
+        for pool in (self._rpc, self._fallback_rpc):
+            if pool is not None and pool.retire():
+                pool.close()
+        self._rpc = self._fallback_rpc = None
+        with self._ws_lock:
+            ws, self._ws = self._ws, None
+        if ws is not None:
+            ws.close()
+        self._http.close()
+        self._listen_pool.shutdown(wait=False)
 
     def __del__(self):
-        self.close()
+        # May run during interpreter shutdown or on a partially constructed client; never raise from here.
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def metrics(self) -> List[Metrics]:
         return self._telemetry.metrics()
 
 
 class TextStream(Iterator[str]):
-    def __init__(self, q: Optional[queue.Queue] = None):
+    def __init__(self):
         super().__init__()
-        self._q = q or queue.Queue()
+        # One writer and one reader: a deque under a single Condition is all the synchronization needed, and each
+        # __call__ appends all of its words under one lock acquisition.
+        self._words: Deque[str] = collections.deque()
+        self._cv = threading.Condition()
+        self._closed = False
 
     def __iter__(self) -> Iterator[str]:
         return self
 
     def __next__(self) -> str:
-        value = self._q.get()
-        if value is None:
-            raise StopIteration()
-        return value
+        with self._cv:
+            while not self._words:
+                if self._closed:
+                    raise StopIteration()
+                self._cv.wait()
+            return self._words.popleft()
 
     def __call__(self, *args: str):
-        for a in args:
-            self._q.put(a)
+        if not args:
+            return
+        with self._cv:
+            self._words.extend(args)
+            self._cv.notify()
+
+    def close(self):
+        with self._cv:
+            self._closed = True
+            self._cv.notify()
+
+
+class _SpscQueue:
+    """Hand-off of audio chunks from the listen thread to the output iterator.
+
+    A deque plus an Event: put() is an append and a set, and get() only blocks when the deque is empty, so
+    chunks don't go through queue.Queue's mutex and condition variables one at a time. With a maxsize, put()
+    blocks while the deque is full, until the consumer catches up or close() is called.
+    """
+    def __init__(self, maxsize: int = 0):
+        self._items: Deque[Optional[bytes]] = collections.deque()
+        self._ready = threading.Event()
+        self._maxsize = maxsize
+        self._space = threading.Event()
+        self._closed = False
+
+    def put(self, item: Optional[bytes]):
+        if self._maxsize:
+            while len(self._items) >= self._maxsize and not self._closed:
+                self._space.wait()
+                self._space.clear()
+        self._items.append(item)
+        self._ready.set()
+
+    def get(self) -> Optional[bytes]:
+        while True:
+            try:
+                item = self._items.popleft()
+            except IndexError:
+                self._ready.wait()
+                self._ready.clear()
+                continue
+            if self._maxsize:
+                self._space.set()
+            return item
 
     def close(self):
-        self._q.put(None)
+        # Ends iteration without waiting for space, and stops the producer from blocking on a consumer that left.
+        self._closed = True
+        self._space.set()
+        self.put(None)
 
 
 class _InputStream:
@@ -825,17 +1320,30 @@ class _InputStream:
        input_stream += 'Add another sentence to the stream.'
        input_stream.done()
     """
-    def __init__(self, client: Client, options: TTSOptions, q: queue.Queue[Optional[bytes]],
+    def __init__(self, client: Client, options: TTSOptions, q: Optional[_SpscQueue],
                  voice_engine: Optional[str], protocol: Optional[str] = None):
         self._input = TextStream()
+        self._listener: Optional[concurrent.futures.Future] = None
+        if q is None:
+            # The paired output stream consumes self._input itself; see Client.get_stream_pair(threaded=False).
+            return
 
         def listen():
-            for output in client.stream_tts_input(self._input, options, voice_engine, protocol):
-                q.put(output)
-            q.put(None)
-
-        self._listener = threading.Thread(None, listen, 'listen-thread')
-        self._listener.start()
+            try:
+                for output in client.stream_tts_input(self._input, options, voice_engine, protocol):
+                    q.put(output)
+            finally:
+                q.put(None)
+                client._listen_slots.release()
+
+        if not client._listen_slots.acquire(blocking=False):
+            raise RuntimeError(f"Too many open stream pairs (max_stream_pairs="
+                               f"{client._advanced.max_stream_pairs}); finish or close one before opening another.")
+        try:
+            self._listener = client._listen_pool.submit(listen)
+        except BaseException:
+            client._listen_slots.release()
+            raise
 
     def __call__(self, *args: str):
         self._input(*args)
@@ -845,7 +1353,8 @@ class _InputStream:
 
     def done(self):
         self._input.close()
-        self._listener.join()
+        if self._listener is not None:
+            self._listener.result()
 
 
 class _OutputStream(Iterator[bytes]):
@@ -856,29 +1365,58 @@ class _OutputStream(Iterator[bytes]):
            <do stuff with audio bytes>
         output_stream.close()
     """
-    def __init__(self, q: queue.Queue[Optional[bytes]]):
-        self._close = threading.Event()
+    def __init__(self, q: _SpscQueue):
         self._q = q
+        self._close_lock = threading.Lock()
+        self._closed = False
+        self._done = False
 
     def __iter__(self) -> Iterator[bytes]:
         return self
 
     def __next__(self) -> bytes:
-        while True:
-            try:
-                value = self._q.get(timeout=0.05)
-                break
-            except queue.Empty as e:
-                if self._close.is_set():
-                    raise StopIteration() from e
-                continue
+        if self._done:
+            raise StopIteration()
+        # Both the listener and close() end the stream with a None sentinel, so a plain blocking get suffices.
+        value = self._q.get()
         if value is None:
+            self._done = True
             raise StopIteration()
         return value
 
     def close(self):
-        self._close.set()
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._q.close()
+
+
+class _GeneratorOutputStream(_OutputStream):
+    """Iterator for output audio that pulls directly from the TTS requests, on the caller's thread."""
+    def __init__(self, gen: Iterator[bytes]):
+        self._gen = gen
+        self._closed = False
+
+    def __next__(self) -> bytes:
+        if self._closed:
+            raise StopIteration()
+        return next(self._gen)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        # Closing the generator ends the request it is streaming now, instead of whenever it is garbage collected.
+        close = getattr(self._gen, "close", None)
+        if close is not None:
+            close()
 
 
 def _audio_begins_at(fmt: Format) -> int:
-    return 0 if fmt in {Format.FORMAT_RAW, Format.FORMAT_MULAW} else 1
+    return _AUDIO_BEGINS_AT[fmt.value]
+
+
+def _backoff_schedule(max_attempts: int, base: float, jitter: float = 0.5, cap: float = 30.0) -> List[float]:
+    """Exponential backoff with jitter, so concurrent clients don't retry in lockstep."""
+    return [min(cap, base * 2 ** i * (1 + random.random() * jitter)) for i in range(max_attempts - 1)]
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 from dataclasses import dataclass
 from datetime import datetime
+import random
 import requests
+import threading
 import time
-from typing import Callable, Awaitable, Optional, Dict, Any
+from typing import Callable, Awaitable, Optional, Dict, Any, Hashable, Tuple
 
 import aiohttp
 
 REQUIRED_MODELS = ["Play3.0-mini", "PlayDialog", "PlayDialogMultilingual"]
 REQUIRED_URLS = ["http_streaming_url", "websocket_url"]
 
+# Coordinates are shared by every client in the process with the same credentials: a fresh entry is returned as is,
+# and concurrent fetches for the same key wait on the one already in flight instead of each calling the API.
+_CACHE_LOCK = threading.Lock()
+_CACHE: Dict[Hashable, Dict[str, Any]] = {}
+_INFLIGHT: Dict[Hashable, concurrent.futures.Future] = {}
+_INFLIGHT_ASYNC: Dict[Tuple[Hashable, asyncio.AbstractEventLoop], asyncio.Future] = {}
+
 
 @dataclass
 class InferenceCoordinatesOptions:
@@ -23,85 +33,189 @@ class InferenceCoordinatesOptions:
     coordinates_expiration_minimal_frequency_ms: int = 60_000
     coordinates_expiration_advance_refresh_ms: int = 300_000
     coordinates_get_api_call_max_retries: int = 3
+    coordinates_retry_base_delay_s: float = 1.0
+    coordinates_retry_max_delay_s: float = 30.0
+    coordinates_retry_jitter: float = 0.5
 
 
-def default_coordinates_generator(user_id: str, api_key: str,
-                                  options: InferenceCoordinatesOptions) -> Dict[str, Any]:
+def default_coordinates_generator(user_id: str, api_key: str, options: InferenceCoordinatesOptions,
+                                  session: Optional[requests.Session] = None) -> Dict[str, Any]:
+    # Pass the client's session so refreshes reuse its pooled connection instead of a new TLS handshake each time.
+    http = session if session is not None else requests
     try:
-        response = requests.post(f"{options.api_url}/sdk-auth",
-                                 headers={"x-user-id": user_id, "authorization": f"Bearer {api_key}"})
+        response = http.post(f"{options.api_url}/sdk-auth",
+                             headers={"x-user-id": user_id, "authorization": f"Bearer {api_key}"})
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
         raise RuntimeError(f"Failed to get inference coordinates: {e}") from e
 
 
-async def default_coordinates_generator_async(user_id: str, api_key: str,
-                                              options: InferenceCoordinatesOptions) -> Dict[str, Any]:
+async def _post_sdk_auth(session: aiohttp.ClientSession, user_id: str, api_key: str,
+                         options: InferenceCoordinatesOptions) -> Dict[str, Any]:
+    async with session.post(f"{options.api_url}/sdk-auth",
+                            headers={"x-user-id": user_id,
+                                     "authorization": f"Bearer {api_key}"}) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def default_coordinates_generator_async(user_id: str, api_key: str, options: InferenceCoordinatesOptions,
+                                              session: Optional[aiohttp.ClientSession] = None) -> Dict[str, Any]:
     try:
+        if session is not None:
+            return await _post_sdk_auth(session, user_id, api_key, options)
         async with aiohttp.ClientSession() as session:
-            async with session.post(f"{options.api_url}/sdk-auth",
-                                    headers={"x-user-id": user_id,
-                                             "authorization": f"Bearer {api_key}"}) as response:
-                response.raise_for_status()
-                return await response.json()
+            return await _post_sdk_auth(session, user_id, api_key, options)
     except requests.RequestException as e:
         raise RuntimeError(f"Failed to get inference coordinates: {e}") from e
 
 
-def get_coordinates(user_id: str, api_key: str,
-                    options: InferenceCoordinatesOptions, attempt: int = 1) -> Dict[str, Any]:
+def _nonstreaming_url(streaming_url: str) -> str:
+    # Only the last "stream" is the endpoint's path segment; a host or earlier path segment may contain it too.
+    head, _, tail = streaming_url.rpartition("stream")
+    return head + tail
+
+
+def _retry_delay(options: InferenceCoordinatesOptions, attempt: int) -> float:
+    # Truncated exponential backoff; the jitter keeps clients that failed together from retrying together.
+    delay = min(options.coordinates_retry_max_delay_s, options.coordinates_retry_base_delay_s * 2 ** (attempt - 1))
+    return delay * (1 + random.uniform(0, options.coordinates_retry_jitter))
+
+
+def _cache_key(user_id: str, api_key: str, options: InferenceCoordinatesOptions, generator: Any) -> Hashable:
+    return user_id, api_key, options.api_url, generator
+
+
+def _cached(key: Hashable, force: bool) -> Optional[Dict[str, Any]]:
+    coordinates = _CACHE.get(key)
+    if force or coordinates is None or coordinates["refresh_at_ms"] <= time.time() * 1000:
+        return None
+    return coordinates
+
+
+def get_coordinates(user_id: str, api_key: str, options: InferenceCoordinatesOptions, attempt: int = 1,
+                    session: Optional[requests.Session] = None, force: bool = False) -> Dict[str, Any]:
+    key = _cache_key(user_id, api_key, options, options.coordinates_generator_function)
+    with _CACHE_LOCK:
+        coordinates = _cached(key, force)
+        if coordinates is not None:
+            return coordinates
+        inflight = _INFLIGHT.get(key)
+        fetching = inflight is None
+        if fetching:
+            inflight = _INFLIGHT[key] = concurrent.futures.Future()
+    if not fetching:
+        return inflight.result()
+
     try:
-        if options.coordinates_generator_function is not None:
-            coordinates = options.coordinates_generator_function(user_id, api_key, options)
-        else:
-            coordinates = default_coordinates_generator(user_id, api_key, options)
-        assert "expires_at" in coordinates, "Coordinates response must contain expires_at"
-        # schedule next refresh
-        dt = datetime.strptime(coordinates["expires_at"], "%Y-%m-%dT%H:%M:%S.%fZ")
-        expires_at_ms = int(dt.timestamp() * 1000)
-        coordinates["refresh_at_ms"] = min(expires_at_ms - options.coordinates_expiration_advance_refresh_ms,
-                                           time.time() * 1000 + options.coordinates_expiration_minimal_frequency_ms)
-        for model in REQUIRED_MODELS:
-            assert model in coordinates, f"Coordinates response must contain model {model}"
-            for url in REQUIRED_URLS:
-                assert url in coordinates[model], \
-                    f"Coordinates response must contain {url} for model {model}"
-            coordinates[model]["http_nonstreaming_url"] = \
-                coordinates[model]["http_streaming_url"].replace("stream", "")
-        return coordinates
-    except Exception as e:
-        if attempt >= options.coordinates_get_api_call_max_retries:
-            raise e
-        else:
-            time.sleep(0.5 ** (attempt + 1))
-            return get_coordinates(user_id, api_key, options, attempt + 1)
-
-
-async def get_coordinates_async(user_id: str, api_key: str,
-                                options: InferenceCoordinatesOptions, attempt: int = 1) -> Dict[str, Any]:
+        coordinates = _fetch_coordinates(user_id, api_key, options, attempt, session)
+    except BaseException as e:
+        with _CACHE_LOCK:
+            del _INFLIGHT[key]
+        inflight.set_exception(e)
+        raise
+    with _CACHE_LOCK:
+        _CACHE[key] = coordinates
+        del _INFLIGHT[key]
+    inflight.set_result(coordinates)
+    return coordinates
+
+
+def _fetch_coordinates(user_id: str, api_key: str, options: InferenceCoordinatesOptions, attempt: int,
+                       session: Optional[requests.Session]) -> Dict[str, Any]:
+    while True:
+        try:
+            if options.coordinates_generator_function is not None:
+                coordinates = options.coordinates_generator_function(user_id, api_key, options)
+            else:
+                coordinates = default_coordinates_generator(user_id, api_key, options, session)
+            assert "expires_at" in coordinates, "Coordinates response must contain expires_at"
+            # schedule next refresh
+            dt = datetime.strptime(coordinates["expires_at"], "%Y-%m-%dT%H:%M:%S.%fZ")
+            expires_at_ms = int(dt.timestamp() * 1000)
+            coordinates["refresh_at_ms"] = min(expires_at_ms - options.coordinates_expiration_advance_refresh_ms,
+                                               time.time() * 1000 + options.coordinates_expiration_minimal_frequency_ms)
+            for model in REQUIRED_MODELS:
+                assert model in coordinates, f"Coordinates response must contain model {model}"
+                for url in REQUIRED_URLS:
+                    assert url in coordinates[model], \
+                        f"Coordinates response must contain {url} for model {model}"
+                coordinates[model]["http_nonstreaming_url"] = \
+                    _nonstreaming_url(coordinates[model]["http_streaming_url"])
+            return coordinates
+        except Exception as e:
+            if attempt >= options.coordinates_get_api_call_max_retries:
+                raise e
+            time.sleep(_retry_delay(options, attempt))
+            attempt += 1
+
+
+async def get_coordinates_async(user_id: str, api_key: str, options: InferenceCoordinatesOptions, attempt: int = 1,
+                                session: Optional[aiohttp.ClientSession] = None,
+                                force: bool = False) -> Dict[str, Any]:
+    key = _cache_key(user_id, api_key, options, options.coordinates_generator_function_async)
+    # asyncio tasks belong to one loop, so in-flight fetches are only shared within a loop.
+    loop = asyncio.get_running_loop()
+    inflight_key = (key, loop)
+    with _CACHE_LOCK:
+        coordinates = _cached(key, force)
+        if coordinates is not None:
+            return coordinates
+        inflight = _INFLIGHT_ASYNC.get(inflight_key)
+        if inflight is None:
+            inflight = _INFLIGHT_ASYNC[inflight_key] = loop.create_task(
+                _fetch_and_cache_async(key, inflight_key, user_id, api_key, options, attempt, session))
+            inflight.add_done_callback(_retrieve_exception)
+    # The fetch runs as its own task, so a caller that is cancelled doesn't cancel it for the others waiting on it.
+    return await asyncio.shield(inflight)
+
+
+async def _fetch_and_cache_async(key: Hashable, inflight_key: Tuple[Hashable, asyncio.AbstractEventLoop],
+                                 user_id: str, api_key: str, options: InferenceCoordinatesOptions, attempt: int,
+                                 session: Optional[aiohttp.ClientSession]) -> Dict[str, Any]:
     try:
-        if options.coordinates_generator_function_async is not None:
-            coordinates = await options.coordinates_generator_function_async(user_id, api_key, options)
-        else:
-            coordinates = await default_coordinates_generator_async(user_id, api_key, options)
-        assert "expires_at" in coordinates, "Coordinates response must contain expires_at"
-        # schedule next refresh
-        dt = datetime.strptime(coordinates["expires_at"], "%Y-%m-%dT%H:%M:%S.%fZ")
-        expires_at_ms = int(dt.timestamp() * 1000)
-        coordinates["refresh_at_ms"] = min(expires_at_ms - options.coordinates_expiration_advance_refresh_ms,
-                                           time.time() * 1000 + options.coordinates_expiration_minimal_frequency_ms)
-        for model in REQUIRED_MODELS:
-            assert model in coordinates, f"Coordinates response must contain model {model}"
-            for url in REQUIRED_URLS:
-                assert url in coordinates[model], \
-                    f"Coordinates response must contain {url} for model {model}"
-            coordinates[model]["http_nonstreaming_url"] = \
-                coordinates[model]["http_streaming_url"].replace("stream", "")
-        return coordinates
-    except Exception as e:
-        if attempt >= options.coordinates_get_api_call_max_retries:
-            raise e
-        else:
-            await asyncio.sleep(0.5 ** (attempt + 1))
-            return await get_coordinates_async(user_id, api_key, options, attempt + 1)
+        coordinates = await _fetch_coordinates_async(user_id, api_key, options, attempt, session)
+    except BaseException:
+        with _CACHE_LOCK:
+            del _INFLIGHT_ASYNC[inflight_key]
+        raise
+    with _CACHE_LOCK:
+        _CACHE[key] = coordinates
+        del _INFLIGHT_ASYNC[inflight_key]
+    return coordinates
+
+
+def _retrieve_exception(task: asyncio.Future):
+    # Every waiter may have been cancelled; don't let a failure nobody awaited be logged as unhandled.
+    if not task.cancelled():
+        task.exception()
+
+
+async def _fetch_coordinates_async(user_id: str, api_key: str, options: InferenceCoordinatesOptions, attempt: int,
+                                   session: Optional[aiohttp.ClientSession]) -> Dict[str, Any]:
+    while True:
+        try:
+            if options.coordinates_generator_function_async is not None:
+                coordinates = await options.coordinates_generator_function_async(user_id, api_key, options)
+            else:
+                coordinates = await default_coordinates_generator_async(user_id, api_key, options, session)
+            assert "expires_at" in coordinates, "Coordinates response must contain expires_at"
+            # schedule next refresh
+            dt = datetime.strptime(coordinates["expires_at"], "%Y-%m-%dT%H:%M:%S.%fZ")
+            expires_at_ms = int(dt.timestamp() * 1000)
+            coordinates["refresh_at_ms"] = min(expires_at_ms - options.coordinates_expiration_advance_refresh_ms,
+                                               time.time() * 1000 + options.coordinates_expiration_minimal_frequency_ms)
+            for model in REQUIRED_MODELS:
+                assert model in coordinates, f"Coordinates response must contain model {model}"
+                for url in REQUIRED_URLS:
+                    assert url in coordinates[model], \
+                        f"Coordinates response must contain {url} for model {model}"
+                coordinates[model]["http_nonstreaming_url"] = \
+                    _nonstreaming_url(coordinates[model]["http_streaming_url"])
+            return coordinates
+        except Exception as e:
+            if attempt >= options.coordinates_get_api_call_max_retries:
+                raise e
+            await asyncio.sleep(_retry_delay(options, attempt))
+            attempt += 1
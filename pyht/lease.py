@@ -1,30 +1,44 @@
 from __future__ import annotations
 
-from datetime import datetime
-import json
+from datetime import datetime, timedelta
 import requests
+import struct
+import time
 from typing import Optional
 
+from .utils import json_loads
+
 
 EPOCH = 1519257480
 DEFAULT_API_URL = "https://api.play.ht/api"
 DEFAULT_GRPC_URL = "prod.turbo.play.ht:443"
 
+# Big-endian created/duration words at byte 64 of the lease, ahead of its JSON metadata.
+_LEASE_HEADER = struct.Struct(">II")
+
 
 class Lease:
+    __slots__ = ("data", "created", "duration", "metadata", "expires", "monotonic_expires", "grpc_addr")
+
     def __init__(self, data: bytes):
         self.data = data
-        self.created = int.from_bytes(self.data[64:68], byteorder="big")
-        self.duration = int.from_bytes(self.data[68:72], byteorder="big")
-        self.metadata = json.loads(self.data[72:].decode())
+        self.created, self.duration = _LEASE_HEADER.unpack_from(self.data, 64)
+        self.metadata = json_loads(self.data[72:])  # both parsers take the UTF-8 bytes without a decode
+        self.grpc_addr: Optional[str] = self.metadata.get("inference_address")
+        # All inputs are immutable, so compute the expiry once rather than on every access.
+        self.expires = datetime.fromtimestamp(self.created + self.duration + EPOCH)
+        # Monotonic-clock equivalent of `expires`: cheap to compare and immune to wall-clock jumps.
+        self.monotonic_expires = time.monotonic() + (self.expires - datetime.now()).total_seconds()
 
     @classmethod
-    def _get(cls, user_id: str, api_key: str, api_url: str, _retry=True) -> bytes:
+    def _get(cls, user_id: str, api_key: str, api_url: str, _retry=True,
+             session: Optional[requests.Session] = None) -> bytes:
         auth_header = (
             f"Bearer {api_key}" if not api_key.startswith("Bearer ") else api_key
         )
         api_headers = {"X-User-Id": user_id, "Authorization": auth_header}
-        with requests.post(
+        http = session if session is not None else requests
+        with http.post(
             f"{api_url}/v2/leases",
             headers=api_headers,
             timeout=60
@@ -34,12 +48,13 @@ class Lease:
                 return response.content
             except requests.HTTPError as e:
                 if _retry and e.response.status_code >= 500:
-                    return cls._get(user_id, api_key, api_url, _retry=False)
+                    return cls._get(user_id, api_key, api_url, _retry=False, session=session)
                 raise e
 
     @classmethod
-    def get(cls, user_id: str, api_key: str, api_url: str = DEFAULT_API_URL) -> "Lease":
-        data = cls._get(user_id, api_key, api_url)
+    def get(cls, user_id: str, api_key: str, api_url: str = DEFAULT_API_URL,
+            session: Optional[requests.Session] = None) -> "Lease":
+        data = cls._get(user_id, api_key, api_url, session=session)
         lease = Lease(data)
 
         assert (
@@ -48,20 +63,20 @@ class Lease:
 
         return lease
 
-    @property
-    def expires(self) -> datetime:
-        return datetime.fromtimestamp(self.created + self.duration + EPOCH)
+    def valid_for(self, duration: timedelta) -> bool:
+        return time.monotonic() + duration.total_seconds() < self.monotonic_expires
 
-    @property
-    def grpc_addr(self) -> Optional[str]:
-        return self.metadata.get("inference_address")
+    def seconds_until(self, before_expiry: timedelta) -> float:
+        return self.monotonic_expires - before_expiry.total_seconds() - time.monotonic()
 
 
 class LeaseFactory:
-    def __init__(self, user_id: str, api_key: str, api_url: str = DEFAULT_API_URL):
+    def __init__(self, user_id: str, api_key: str, api_url: str = DEFAULT_API_URL,
+                 session: Optional[requests.Session] = None):
         self._user = user_id
         self._key = api_key
         self._url = api_url
+        self._session = session
 
     def __call__(self) -> Lease:
-        return Lease.get(self._user, self._key, self._url)
+        return Lease.get(self._user, self._key, self._url, self._session)
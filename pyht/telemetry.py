@@ -1,23 +1,24 @@
 from __future__ import annotations
 
+import collections
 import time
+from typing import Any, Deque, Dict, List, Optional
 
 
 class Telemetry:
     def __init__(self, buffer_size: int = 1000):
-        self._metrics = []
+        # A bounded deque drops the oldest entry in O(1) once full; list.pop(0) shifted the whole buffer.
+        self._metrics: Deque[Metrics] = collections.deque(maxlen=buffer_size)
         self._buffer_size = buffer_size
 
     def start(self, operation: str) -> Metrics:
         metrics = Metrics()
         metrics.start(operation)
-        if len(self._metrics) >= self._buffer_size:
-            self._metrics.pop(0)
         self._metrics.append(metrics)
         return metrics
 
     def metrics(self) -> list[Metrics]:
-        return self._metrics
+        return list(self._metrics)
 
 
 class Metrics:
@@ -57,12 +58,16 @@ class Metrics:
         self.end_time = None
         self.duration = None
         self.counters = {}
-        self.attributes = {}
+        # Raw attribute values; they're only formatted as strings when read, keeping str() off the request path.
+        self._attributes: Dict[str, List[Any]] = {}
         self.timers = {}
+        # start_time/end_time are reported wall-clock timestamps; duration is measured on the monotonic clock.
+        self._start_perf: Optional[float] = None
 
     def start(self, operation: str) -> Metrics:
         self.operation = operation
         self.start_time = time.time()
+        self._start_perf = time.perf_counter()
         self.start_timer(operation)
         return self
 
@@ -71,7 +76,10 @@ class Metrics:
         return self
 
     def start_timer(self, name: str) -> Metrics:
-        timer = self.timers.setdefault(name, Timer(name))
+        # Not setdefault(): its default argument would build a Timer even when one already exists.
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = Timer(name)
         timer.start()
         return self
 
@@ -86,10 +94,26 @@ class Metrics:
         self.timers[name] = Timer(name, duration)
         return self
 
-    def append(self, key: str, value: str) -> Metrics:
-        self.attributes.setdefault(key, []).append(value)
+    def append(self, key: str, value: Any) -> Metrics:
+        values = self._attributes.get(key)
+        if values is None:
+            values = self._attributes[key] = []
+        values.append(value)
         return self
 
+    @property
+    def attributes(self) -> Dict[str, List[str]]:
+        # Stringify in place and hand out the live dict, so changes made through it stick.
+        for values in self._attributes.values():
+            for i, value in enumerate(values):
+                if not isinstance(value, str):
+                    values[i] = str(value)
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, attributes: Dict[str, List[Any]]):
+        self._attributes = attributes
+
     def finish_ok(self):
         self.inc("ok")
         self.finish("ok")
@@ -101,21 +125,28 @@ class Metrics:
 
     def finish(self, status: str):
         now = time.time()
+        perf_now = time.perf_counter()
         self.status = status
         if self.start_time is None:
             self.start_time = now
+        if self._start_perf is None:
+            self._start_perf = perf_now
         self.end_time = now
-        self.duration = now - self.start_time
+        self.duration = perf_now - self._start_perf
 
         # finish all timers - finishing is idempotent so it's okay if a timer was finished before
         for timer in self.timers.values():
-            timer.finish()
+            timer.finish(perf_now)
 
     def __repr__(self):
-        return repr(self.__dict__)
+        fields = {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        fields["attributes"] = self.attributes
+        return repr(fields)
 
 
 class Timer:
+    __slots__ = ("name", "last_start", "duration")
+
     def __init__(self, name: str, duration: float = 0):
         self.name = name
         self.last_start = None
@@ -127,10 +158,10 @@ class Timer:
     def add(self, duration: float):
         self.duration += duration
 
-    def finish(self):
+    def finish(self, now: Optional[float] = None):
         if self.last_start is None:
             return
-        self.duration += (time.perf_counter() - self.last_start)
+        self.duration += ((time.perf_counter() if now is None else now) - self.last_start)
         self.last_start = None
 
     def format(self) -> str:
@@ -1,24 +1,58 @@
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import re
-from typing import List, Union, Tuple, Optional
+from typing import Any, List, Union, Tuple, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder.
+    orjson = None
 
 SENTENCE_END_REGEX = re.compile('.*[-.!?;:…]$')
+SENTENCE_END_CHARS = frozenset('-.!?;:…')
+SSML_TAG_REGEX = re.compile(r'<[^>]*>')
+
+
+@functools.lru_cache(maxsize=256)
+def _remove_ssml_tags(text: str) -> str:
+    if '<' not in text:
+        return text
+    return SSML_TAG_REGEX.sub('', text)
 
 
 def prepare_text(text: Union[str, List[str]], remove_ssml_tags: bool = True) -> List[str]:
     if isinstance(text, str):
-        text = [text]
+        return [_remove_ssml_tags(text) if remove_ssml_tags else text]
     if remove_ssml_tags:
-        text = [re.sub(r'<[^>]*>', '', x) for x in text]
+        return list(map(_remove_ssml_tags, text))
     return text
 
 
-def _convert_deprecated_voice_engine(voice_engine: str, protocol: Optional[str]) -> Tuple[str, str]:
-    _voice_engine, _protocol = voice_engine.rsplit("-", 1)
+def is_sentence_end(text: str) -> bool:
+    # Same test as SENTENCE_END_REGEX, without entering the regex engine for every streamed token.
+    return text[-1:] in SENTENCE_END_CHARS
+
+
+def json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _convert_deprecated_voice_engine(voice_engine: str, protocol: Optional[str],
+                                     deprecations: List[str]) -> Tuple[str, str]:
+    _voice_engine, _, _protocol = voice_engine.rpartition("-")
     if not protocol or protocol == _protocol:
-        logging.warning(f"Voice engine {_voice_engine}-{_protocol} is deprecated; \
+        deprecations.append(f"Voice engine {_voice_engine}-{_protocol} is deprecated; \
                         separately pass voice_engine='{_voice_engine}' and protocol='{_protocol}'.")
         return _voice_engine, _protocol
     else:
@@ -26,22 +60,50 @@ def _convert_deprecated_voice_engine(voice_engine: str, protocol: Optional[str])
                          as well as mismatched protocol {protocol}.")
 
 
+_VALID_PROTOCOLS = frozenset({"http", "ws", "grpc"})
+_PLAY3_ENGINES = frozenset({"Play3.0-mini", "Play3.0-mini-http", "Play3.0-mini-ws", "Play3.0-mini-grpc",
+                            "Play3.0", "Play3.0-http", "Play3.0-ws", "Play3.0-grpc"})
+_DIALOG_ENGINES = frozenset({"PlayDialog", "PlayDialog-http", "PlayDialog-ws", "PlayDialogMultilingual",
+                             "PlayDialogMultilingual-http", "PlayDialogMultilingual-ws"})
+
+
 def get_voice_engine_and_protocol(voice_engine: Optional[str], protocol: Optional[str]) -> Tuple[str, str]:
-    if protocol and protocol not in ["http", "ws", "grpc"]:
+    voice_engine, protocol, messages, deprecations = _resolve_voice_engine_and_protocol(voice_engine, protocol)
+    for message in messages:
+        logging.warning(message)
+    for message in deprecations:
+        _warn_once(message)
+    return voice_engine, protocol
+
+
+# Only the finite set of accepted engine names can be deprecated, so this cache stays small.
+@functools.lru_cache(maxsize=None)
+def _warn_once(message: str):
+    logging.warning(message)
+
+
+# The resolution itself is pure, so it's cached along with the warnings it produced. get_voice_engine_and_protocol
+# logs the default-selection messages on every call and each deprecation once per process.
+@functools.lru_cache(maxsize=64)
+def _resolve_voice_engine_and_protocol(voice_engine: Optional[str],
+                                       protocol: Optional[str]) -> Tuple[str, str, Tuple[str, ...], Tuple[str, ...]]:
+    messages: List[str] = []
+    deprecations: List[str] = []
+    if protocol and protocol not in _VALID_PROTOCOLS:
         raise ValueError(f"Invalid protocol: {protocol} (must be http, ws, or grpc).")
 
     # this is a bunch of tedious backward compatibility
 
     if not voice_engine:
         if not protocol:
-            logging.warning("No voice engine or protocol specified; using Play3.0-mini-http.")
+            messages.append("No voice engine or protocol specified; using Play3.0-mini-http.")
             voice_engine = "Play3.0-mini"
             protocol = "http"
         elif protocol in ["http", "ws"]:
-            logging.warning(f"No voice engine specified and protocol is {protocol}; using Play3.0-mini-{protocol}.")
+            messages.append(f"No voice engine specified and protocol is {protocol}; using Play3.0-mini-{protocol}.")
             voice_engine = "Play3.0-mini"
         elif protocol == "grpc":
-            logging.warning("No voice engine specified and protocol is grpc; using PlayHT2.0-turbo.")
+            messages.append("No voice engine specified and protocol is grpc; using PlayHT2.0-turbo.")
             voice_engine = "PlayHT2.0-turbo"
         else:
             raise ValueError(f"No voice engine specified and invalid protocol {protocol} (must be http, ws, or grpc).")
@@ -52,38 +114,36 @@ def get_voice_engine_and_protocol(voice_engine: Optional[str], protocol: Optiona
         if protocol != "grpc":
             raise ValueError(f"Voice engine PlayHT2.0-turbo does not support protocol {protocol} (must be grpc).")
 
-    elif voice_engine in ["Play3.0-mini", "Play3.0-mini-http", "Play3.0-mini-ws", "Play3.0-mini-grpc",
-                          "Play3.0", "Play3.0-http", "Play3.0-ws", "Play3.0-grpc"]:
+    elif voice_engine in _PLAY3_ENGINES:
         if "mini" not in voice_engine:
-            logging.warning("Voice engine Play3.0 is deprecated; use Play3.0-mini.")
+            deprecations.append("Voice engine Play3.0 is deprecated; use Play3.0-mini.")
             voice_engine = voice_engine.replace("Play3.0", "Play3.0-mini")
         if voice_engine == "Play3.0-mini":
             if not protocol:
-                logging.warning("No protocol specified; using http")
+                messages.append("No protocol specified; using http")
                 protocol = "http"
-            if protocol not in ["http", "ws", "grpc"]:
+            if protocol not in _VALID_PROTOCOLS:
                 raise ValueError(f"Voice engine Play3.0-mini does not support protocol {protocol} \
                                  (must be http, ws, or grpc [grpc for on-prem customers only]).")
         else:
-            voice_engine, protocol = _convert_deprecated_voice_engine(voice_engine, protocol)
+            voice_engine, protocol = _convert_deprecated_voice_engine(voice_engine, protocol, deprecations)
 
-    elif voice_engine in ["PlayDialog", "PlayDialog-http", "PlayDialog-ws", "PlayDialogMultilingual",
-                          "PlayDialogMultilingual-http", "PlayDialogMultilingual-ws"]:
-        if voice_engine in ["PlayDialog", "PlayDialogMultilingual"]:
+    elif voice_engine in _DIALOG_ENGINES:
+        if voice_engine in ("PlayDialog", "PlayDialogMultilingual"):
             if not protocol:
-                logging.warning("No protocol specified; using http")
+                messages.append("No protocol specified; using http")
                 protocol = "http"
             if protocol not in ["http", "ws"]:
                 raise ValueError(f"Voice engine {voice_engine} does not support protocol {protocol} \
                                  (must be http or ws).")
         else:
-            voice_engine, protocol = _convert_deprecated_voice_engine(voice_engine, protocol)
+            voice_engine, protocol = _convert_deprecated_voice_engine(voice_engine, protocol, deprecations)
 
     else:
         raise ValueError(f"Invalid voice engine: {voice_engine} (must be Play3.0-mini, PlayDialog, \
                          PlayDialogMultilingual, or PlayHT2.0-turbo).")
 
-    return voice_engine, protocol
+    return voice_engine, protocol, tuple(messages), tuple(deprecations)
 
 
 def main():
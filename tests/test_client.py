@@ -0,0 +1,318 @@
+import asyncio
+import gc
+import json
+import struct
+import threading
+import time
+import weakref
+from unittest import mock
+
+import pytest
+
+from pyht import async_client as pyht_async_client
+from pyht import client as pyht_client
+from pyht.async_client import AsyncClient
+from pyht.client import _ChannelPool, _RefreshScheduler, _SpscQueue, Client, TTSOptions
+from pyht.lease import EPOCH, Lease
+
+COORDINATES = {
+    model: {"http_streaming_url": "https://example.test/stream", "websocket_url": "wss://example.test/ws"}
+    for model in ["Play3.0-mini", "PlayDialog", "PlayDialogMultilingual"]
+}
+
+
+def make_lease(addr: str, duration: int = 3600) -> Lease:
+    created = int(time.time()) - EPOCH
+    return Lease(b"\0" * 64 + struct.pack(">II", created, duration) + json.dumps({"inference_address": addr}).encode())
+
+
+@pytest.fixture
+def client():
+    c = Client("user", "key", auto_connect=False,
+               advanced=Client.AdvancedOptions(insecure=True, auto_refresh_lease=False, max_stream_pairs=2))
+    yield c
+    c.close()
+
+
+class FakeWebSocket:
+    def __init__(self, *args, **kwargs):
+        self.closed = False
+        self._frames = []
+
+    def send(self, payload):
+        self._frames = [b"audio-1", b"audio-2", json.dumps({"type": "end"})]
+
+    def __iter__(self):
+        while self._frames:
+            yield self._frames.pop(0)
+
+    def close(self):
+        self.closed = True
+
+
+class TestChannelPool:
+    def test_round_robin(self):
+        pool = _ChannelPool("addr", lambda options: mock.MagicMock(), 3)
+        stubs = [pool.next_stub() for _ in range(6)]
+        assert stubs[:3] == stubs[3:]
+        assert len(set(map(id, stubs[:3]))) == 3
+
+    def test_retired_pool_closes_after_last_release(self):
+        pool = _ChannelPool("addr", lambda options: mock.MagicMock(), 1)
+        assert pool.acquire()
+        assert not pool.retire()
+        assert pool.acquire()
+        assert not pool.release()
+        assert pool.release()
+        assert not pool.acquire()
+
+    def test_idle_pool_closes_on_retire(self):
+        pool = _ChannelPool("addr", lambda options: mock.MagicMock(), 1)
+        assert pool.retire()
+        assert not pool.acquire()
+
+
+class TestWebSocket:
+    @pytest.fixture(autouse=True)
+    def fake_ws(self, client):
+        client._inference_coordinates = COORDINATES
+        client._coordinates_refresh_at = float("inf")
+        sockets = []
+
+        def connect(*args, **kwargs):
+            sockets.append(FakeWebSocket())
+            return sockets[-1]
+
+        with mock.patch.object(pyht_client, "connect", side_effect=connect):
+            yield sockets
+
+    def test_reuses_socket_after_complete_response(self, client, fake_ws):
+        options = TTSOptions(voice="voice")
+        assert list(client.tts("Hello.", options, "Play3.0-mini", "ws")) == [b"audio-1", b"audio-2"]
+        assert list(client.tts("Hello.", options, "Play3.0-mini", "ws")) == [b"audio-1", b"audio-2"]
+        assert len(fake_ws) == 1 and not fake_ws[0].closed
+
+    def test_abandoned_request_closes_socket(self, client, fake_ws):
+        audio = client.tts("Hello.", TTSOptions(voice="voice"), "Play3.0-mini", "ws")
+        next(audio)
+        audio.close()
+        assert fake_ws[0].closed
+        assert client._ws is None
+
+    def test_nested_requests_do_not_deadlock(self, client, fake_ws):
+        options = TTSOptions(voice="voice")
+        outer = client.tts("Hello.", options, "Play3.0-mini", "ws")
+        next(outer)
+        assert list(client.tts("Again.", options, "Play3.0-mini", "ws")) == [b"audio-1", b"audio-2"]
+        assert list(outer) == [b"audio-2"]
+        assert len(fake_ws) == 2
+
+
+class CoordinatesGenerator:
+    """Hands out coordinates due for refresh after `first_refresh_in` seconds, then an hour later."""
+    def __init__(self, first_refresh_in: float):
+        self.first_refresh_in = first_refresh_in
+        self.fetches = []
+        self.refreshed = threading.Event()
+
+    def __call__(self, user_id, api_key, options):
+        refresh_in = self.first_refresh_in if not self.fetches else 3600
+        self.fetches.append((threading.current_thread().name, time.monotonic()))
+        if len(self.fetches) > 1:
+            self.refreshed.set()
+        return dict(COORDINATES, refresh_at_ms=(time.time() + refresh_in) * 1000)
+
+    async def fetch_async(self, user_id, api_key, options):
+        return self(user_id, api_key, options)
+
+
+class TestCoordinatesRefresh:
+    def test_refreshes_before_deadline_off_the_request_path(self, client):
+        generator = CoordinatesGenerator(first_refresh_in=0.5)
+        client._advanced.inference_coordinates_options.coordinates_generator_function = generator
+        with mock.patch.object(pyht_client, "_COORDINATES_REFRESH_MARGIN", 0.3):
+            client.ensure_inference_coordinates()
+            deadline = client._coordinates_refresh_at
+            assert generator.refreshed.wait(1)
+        thread, fetched_at = generator.fetches[1]
+        assert fetched_at < deadline
+        assert thread.startswith("lease-refresh")
+
+        time.sleep(max(0.0, deadline - time.monotonic()))
+        client.ensure_inference_coordinates()
+        assert len(generator.fetches) == 2
+
+    def test_close_cancels_refresh(self, client):
+        generator = CoordinatesGenerator(first_refresh_in=0.5)
+        client._advanced.inference_coordinates_options.coordinates_generator_function = generator
+        with mock.patch.object(pyht_client, "_COORDINATES_REFRESH_MARGIN", 0.1):
+            client.ensure_inference_coordinates()
+            client.close()
+            assert not generator.refreshed.wait(0.5)
+
+    def test_async_refreshes_before_deadline(self):
+        generator = CoordinatesGenerator(first_refresh_in=0.5)
+
+        async def main():
+            async_client = AsyncClient("user", "key", auto_connect=False,
+                                       advanced=AsyncClient.AdvancedOptions(auto_refresh_lease=False))
+            async_client._advanced.inference_coordinates_options.coordinates_generator_function_async = \
+                generator.fetch_async
+            try:
+                await async_client.ensure_inference_coordinates()
+                deadline = async_client._coordinates_refresh_at
+                while len(generator.fetches) < 2 and time.monotonic() < deadline:
+                    await asyncio.sleep(0.01)
+                assert len(generator.fetches) == 2
+                assert generator.fetches[1][1] < deadline
+            finally:
+                await async_client.close()
+            await asyncio.sleep(0)
+            assert async_client._coordinates_refresh_future.cancelled()
+
+        with mock.patch.object(pyht_async_client, "_COORDINATES_REFRESH_MARGIN", 0.3):
+            asyncio.run(main())
+
+
+class TestLeaseRefresh:
+    def test_concurrent_refreshes_fetch_once(self, client):
+        fetches = []
+
+        def lease_factory():
+            fetches.append(1)
+            time.sleep(0.1)
+            return make_lease("a.test:443")
+
+        client._lease_factory = lease_factory
+        threads = [threading.Thread(target=client.refresh_lease) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(fetches) == 1
+        assert client._rpc is not None and client._rpc.addr == "a.test:443"
+
+    def test_moved_address_retires_pool_in_use(self, client):
+        leases = iter([make_lease("a.test:443"), make_lease("b.test:443")])
+        client._lease_factory = lambda: next(leases)
+        client.refresh_lease()
+        old = client._rpc
+        assert old is not None and old.acquire()
+
+        client._lease = None
+        with mock.patch.object(old, "close") as close:
+            client.refresh_lease()
+            assert client._rpc is not old
+            close.assert_not_called()
+            assert old.release()
+
+    def test_refresh_after_close_raises(self, client):
+        client.close()
+        with pytest.raises(RuntimeError):
+            client.refresh_lease()
+
+
+class TestRefreshScheduler:
+    def test_runs_due_callbacks_and_skips_cancelled(self):
+        scheduler = _RefreshScheduler()
+        ran = []
+        done = threading.Event()
+
+        class Target:
+            def callback(self, token):
+                ran.append(token)
+                done.set()
+
+        target = Target()
+        cancelled = scheduler.schedule(target.callback, 0.01)
+        scheduler.cancel(cancelled)
+        kept = scheduler.schedule(target.callback, 0.02)
+        assert done.wait(1)
+        time.sleep(0.05)
+        assert ran == [kept]
+
+    def test_slow_callback_does_not_block_others(self):
+        scheduler = _RefreshScheduler()
+        fast_ran = threading.Event()
+        release = threading.Event()
+
+        class Target:
+            def slow(self, token):
+                release.wait(1)
+
+            def fast(self, token):
+                fast_ran.set()
+
+        target = Target()
+        scheduler.schedule(target.slow, 0)
+        scheduler.schedule(target.fast, 0.01)
+        assert fast_ran.wait(0.5)
+        release.set()
+
+    def test_pending_keepalive_does_not_keep_client_alive(self):
+        c = Client("user", "key", auto_connect=False, advanced=Client.AdvancedOptions(keepalive_interval=60))
+        c._schedule_keepalive()
+        ref = weakref.ref(c)
+        del c
+        gc.collect()
+        assert ref() is None
+
+
+class TestSpscQueue:
+    def test_put_blocks_while_full(self):
+        q = _SpscQueue(maxsize=1)
+        q.put(b"first")
+        put_done = threading.Event()
+
+        def producer():
+            q.put(b"second")
+            put_done.set()
+
+        threading.Thread(target=producer, daemon=True).start()
+        assert not put_done.wait(0.05)
+        assert q.get() == b"first"
+        assert put_done.wait(1)
+        assert q.get() == b"second"
+
+    def test_close_unblocks_producer(self):
+        q = _SpscQueue(maxsize=1)
+        q.put(b"first")
+        put_done = threading.Event()
+
+        def producer():
+            q.put(b"second")
+            put_done.set()
+
+        threading.Thread(target=producer, daemon=True).start()
+        q.close()
+        assert put_done.wait(1)
+
+
+class TestStreamPair:
+    @pytest.fixture(autouse=True)
+    def fake_tts(self, client):
+        def tts(text, options, voice_engine=None, protocol=None, streaming=True):
+            yield text.encode()
+
+        client.tts = tts
+
+    def test_refuses_pairs_beyond_listener_cap(self, client):
+        options = TTSOptions(voice="voice")
+        pairs = [client.get_stream_pair(options) for _ in range(2)]
+        with pytest.raises(RuntimeError):
+            client.get_stream_pair(options)
+
+        input_stream, output_stream = pairs[0]
+        input_stream("Hello.")
+        input_stream.done()
+        assert list(output_stream) == [b"Hello."]
+        client.get_stream_pair(options)[0].done()
+        pairs[1][0].done()
+
+    def test_unthreaded_close_closes_generator(self, client):
+        input_stream, output_stream = client.get_stream_pair(TTSOptions(voice="voice"), threaded=False)
+        input_stream("One.", "Two.")
+        input_stream.done()
+        assert next(output_stream) == b"One."
+        output_stream.close()
+        assert list(output_stream) == []
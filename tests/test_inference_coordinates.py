@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from pyht import inference_coordinates
+from pyht.inference_coordinates import InferenceCoordinatesOptions, get_coordinates, get_coordinates_async
+
+
+def make_coordinates():
+    expires_at = (datetime.now() + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    coordinates = {"expires_at": expires_at}
+    for model in inference_coordinates.REQUIRED_MODELS:
+        coordinates[model] = {"http_streaming_url": "https://example.test/stream",
+                              "websocket_url": "wss://example.test/ws"}
+    return coordinates
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    inference_coordinates._CACHE.clear()
+    yield
+    inference_coordinates._CACHE.clear()
+
+
+class TestCoordinatesCache:
+    def test_clients_share_cached_coordinates(self):
+        fetches = []
+
+        def generator(user_id, api_key, options):
+            fetches.append(user_id)
+            return make_coordinates()
+
+        options = InferenceCoordinatesOptions(coordinates_generator_function=generator)
+        first = get_coordinates("user", "key", options)
+        assert get_coordinates("user", "key", options) is first
+        assert first["Play3.0-mini"]["http_nonstreaming_url"] == "https://example.test/"
+        assert len(fetches) == 1
+
+        assert get_coordinates("user", "key", options, force=True) is not first
+        assert len(fetches) == 2
+
+    def test_concurrent_threads_fetch_once(self):
+        fetches = []
+
+        def generator(user_id, api_key, options):
+            fetches.append(user_id)
+            time.sleep(0.1)
+            return make_coordinates()
+
+        options = InferenceCoordinatesOptions(coordinates_generator_function=generator)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_coordinates("user", "key", options)))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(fetches) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_async_fetch_survives_cancelled_starter(self):
+        fetches = []
+
+        async def generator(user_id, api_key, options):
+            fetches.append(user_id)
+            await asyncio.sleep(0.05)
+            return make_coordinates()
+
+        async def main():
+            options = InferenceCoordinatesOptions(coordinates_generator_function_async=generator)
+            starter = asyncio.ensure_future(get_coordinates_async("user", "key", options))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(get_coordinates_async("user", "key", options))
+            await asyncio.sleep(0)
+            starter.cancel()
+            coordinates = await waiter
+            assert starter.cancelled()
+            assert await get_coordinates_async("user", "key", options) is coordinates
+
+        asyncio.run(main())
+        assert len(fetches) == 1
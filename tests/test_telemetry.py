@@ -0,0 +1,24 @@
+import pytest
+
+from pyht.telemetry import Metrics, Telemetry, Timer
+
+
+class TestMetrics:
+    def test_supports_vars_and_ad_hoc_attributes(self):
+        metrics = Telemetry().start("tts-request")
+        metrics.request_id = "abc"
+        assert vars(metrics)["operation"] == "tts-request"
+        assert "request_id" in repr(metrics)
+
+    def test_attributes_are_stringified_and_live(self):
+        metrics = Metrics()
+        metrics.append("endpoint", 1).append("endpoint", "host")
+        attributes = metrics.attributes
+        assert attributes == {"endpoint": ["1", "host"]}
+        attributes["text"] = ["Hello."]
+        assert metrics.attributes["text"] == ["Hello."]
+
+    def test_timer_keeps_slots(self):
+        timer = Timer("tts-request")
+        with pytest.raises(AttributeError):
+            timer.extra = 1
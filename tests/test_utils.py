@@ -1,3 +1,5 @@
+import logging
+
 from pyht import utils
 
 
@@ -11,3 +13,31 @@ class TestSsmlRemoval:
         expected_text = "already normalized text"
         text = utils.prepare_text(expected_text)
         assert text == [expected_text]
+
+    def test_list_input(self):
+        text = utils.prepare_text(["<speak>First.</speak>", "Second."])
+        assert text == ["First.", "Second."]
+
+
+class TestSentenceEnd:
+    def test_matches_regex(self):
+        for token in ["end.", "what?", "wow!", "list:", "pause;", "dash-", "trail…", "word", "", "3.5x"]:
+            assert utils.is_sentence_end(token) == (utils.SENTENCE_END_REGEX.match(token) is not None)
+
+
+class TestVoiceEngineWarnings:
+    def test_deprecation_logged_once_per_input(self, caplog):
+        utils._warn_once.cache_clear()
+        with caplog.at_level(logging.WARNING):
+            for _ in range(2):
+                assert utils.get_voice_engine_and_protocol("Play3.0-mini-http", None) == ("Play3.0-mini", "http")
+        assert len([r for r in caplog.records if "deprecated" in r.getMessage()]) == 1
+
+    def test_defaults_logged_on_every_call(self, caplog):
+        utils._warn_once.cache_clear()
+        with caplog.at_level(logging.WARNING):
+            for _ in range(2):
+                assert utils.get_voice_engine_and_protocol("Play3.0", None) == ("Play3.0-mini", "http")
+        messages = [r.getMessage() for r in caplog.records]
+        assert messages.count("Voice engine Play3.0 is deprecated; use Play3.0-mini.") == 1
+        assert messages.count("No protocol specified; using http") == 2